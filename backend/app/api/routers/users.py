@@ -5,7 +5,11 @@ from pydantic import BaseModel, Field
 
 from app.api.deps import get_db
 from app.core.rate_limit import limiter, RateLimits
+from app.schemas.order import OrderListResponse
+from app.schemas.subscription import SubscriptionStatus
 from app.schemas.user import UserCreate, UserUpdate, UserOut
+from app.services.order_service import OrderService
+from app.services.subscription_service import SubscriptionService
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -27,6 +31,13 @@ class AdminListResponse(BaseModel):
     total: int
 
 
+class UserContextResponse(BaseModel):
+    """Response schema for a user's bot context in one round trip."""
+    user: UserOut
+    subscription: SubscriptionStatus | None = None
+    recent_orders: OrderListResponse | None = None
+
+
 @router.post(
     "/users",
     response_model=UserOut,
@@ -86,6 +97,40 @@ async def update_user(
     return user
 
 
+@router.get(
+    "/users/{telegram_id}/context",
+    response_model=UserContextResponse,
+    summary="Get user context",
+    description="Get user, subscription status and recent orders in a single response",
+)
+async def get_user_context(
+    telegram_id: int,
+    include: list[str] = Query(
+        ["user", "subscription", "recent_orders"],
+        description="Parts to include: subscription, recent_orders (user is always included)",
+    ),
+    orders_page_size: int = Query(5, ge=1, le=100, description="Number of recent orders"),
+    db: AsyncSession = Depends(get_db),
+) -> UserContextResponse:
+    """Get user with subscription status and recent orders."""
+    service = UserService(db)
+    user = await service.get_user_by_telegram_id(telegram_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with telegram_id {telegram_id} not found"
+        )
+    
+    context = UserContextResponse(user=user)
+    if "subscription" in include:
+        context.subscription = await SubscriptionService(db).get_user_status(user.id)
+    if "recent_orders" in include:
+        context.recent_orders = await OrderService(db).get_user_orders(
+            user_id=user.id, page=1, page_size=orders_page_size
+        )
+    return context
+
+
 # ==================== Admin Management Endpoints ====================
 
 
@@ -56,6 +56,41 @@ class TestUsersAPI:
         
         assert response.status_code == 404
     
+    @pytest.mark.asyncio
+    async def test_get_user_context(self, client: AsyncClient, sample_user_data):
+        """Test GET /api/v1/users/{telegram_id}/context."""
+        await client.post("/api/v1/users", json=sample_user_data)
+        
+        response = await client.get(f"/api/v1/users/{sample_user_data['telegram_id']}/context")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["user"]["telegram_id"] == sample_user_data["telegram_id"]
+        assert data["subscription"] is not None
+        assert data["recent_orders"]["items"] == []
+    
+    @pytest.mark.asyncio
+    async def test_get_user_context_include(self, client: AsyncClient, sample_user_data):
+        """Test GET /api/v1/users/{telegram_id}/context with selected parts."""
+        await client.post("/api/v1/users", json=sample_user_data)
+        
+        response = await client.get(
+            f"/api/v1/users/{sample_user_data['telegram_id']}/context",
+            params={"include": "recent_orders", "orders_page_size": 10},
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["subscription"] is None
+        assert data["recent_orders"]["page_size"] == 10
+    
+    @pytest.mark.asyncio
+    async def test_get_user_context_not_found(self, client: AsyncClient):
+        """Test GET /api/v1/users/{telegram_id}/context - not found."""
+        response = await client.get("/api/v1/users/999999999/context")
+        
+        assert response.status_code == 404
+    
     @pytest.mark.asyncio
     async def test_update_user(self, client: AsyncClient, sample_user_data):
         """Test PATCH /api/v1/users/{telegram_id}."""
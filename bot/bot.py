@@ -44,6 +44,7 @@ from handlers.flows.catalog_flow import (
     handle_back_to_admin,
 )
 from utils.flow_manager import get_step, FLOW_CATALOG, get_flow
+from utils.api_client import api_client
 
 # Import customer flow handlers
 from handlers.customer_questionnaire import (
@@ -68,6 +69,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def post_init(application: Application) -> None:
+    """Warm up the backend API client before polling starts."""
+    await api_client.startup()
+
+
+async def post_shutdown(application: Application) -> None:
+    """Release backend API connections on shutdown."""
+    await api_client.close()
+
+
 def main() -> None:
     """Start the bot."""
     token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -76,7 +87,13 @@ def main() -> None:
         raise ValueError("TELEGRAM_BOT_TOKEN environment variable is not set")
     
     # Create application
-    application = Application.builder().token(token).build()
+    application = (
+        Application.builder()
+        .token(token)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
     # ============== Command Handlers ==============
     application.add_handler(CommandHandler("start", start_command))
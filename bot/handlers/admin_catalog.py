@@ -12,6 +12,7 @@ from telegram.ext import (
 
 from utils.api_client import api_client
 from utils.breadcrumb import Breadcrumb, BreadcrumbPath, get_breadcrumb
+from utils.helpers import parse_placeholder_coords
 from keyboards.manager import get_main_menu_keyboard
 
 logger = logging.getLogger(__name__)
@@ -1525,11 +1526,8 @@ async def template_set_placeholder(update: Update, context: ContextTypes.DEFAULT
     text = update.message.text.strip()
     
     try:
-        parts = [int(p.strip()) for p in text.split(',')]
-        if len(parts) != 4:
-            raise ValueError("Need 4 values")
-        x, y, w, h = parts
-    except (ValueError, IndexError):
+        x, y, w, h = parse_placeholder_coords(text)
+    except ValueError:
         await update.message.reply_text(
             "❌ فرمت نادرست. لطفاً 4 عدد با کاما جدا شده وارد کنید:\n"
             "x,y,width,height\n"
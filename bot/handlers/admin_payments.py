@@ -3,6 +3,7 @@
 All admin messages include breadcrumb navigation for better UX.
 """
 
+import asyncio
 import logging
 from telegram import Update, ReplyKeyboardMarkup
 from telegram.ext import (
@@ -594,8 +595,11 @@ async def handle_new_admin_id(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text(msg, reply_markup=get_cancel_add_admin_keyboard())
         return AWAITING_NEW_ADMIN_ID
     
-    # Get current user (admin)
-    user = await api_client.get_user(update.effective_user.id)
+    # Get current user (admin) and the target user concurrently
+    user, target_user = await asyncio.gather(
+        api_client.get_user(update.effective_user.id),
+        api_client.get_user(new_admin_telegram_id),
+    )
     if not user:
         bc.set_path(BreadcrumbPath.ADMIN_MENU)
         msg = bc.format_message("❌ خطا در دریافت اطلاعات کاربر.")
@@ -603,7 +607,6 @@ async def handle_new_admin_id(update: Update, context: ContextTypes.DEFAULT_TYPE
         return ADMIN_MENU
     
     # Check if user exists
-    target_user = await api_client.get_user(new_admin_telegram_id)
     if not target_user:
         bc.set_path(BreadcrumbPath.ADMIN_ADD)
         msg = bc.format_message(
@@ -615,7 +618,7 @@ async def handle_new_admin_id(update: Update, context: ContextTypes.DEFAULT_TYPE
         return AWAITING_NEW_ADMIN_ID
     
     # Promote to admin
-    result = await api_client.promote_to_admin(
+    result = await api_client.promote_to_admin_by_telegram_id(
         target_telegram_id=new_admin_telegram_id,
         admin_id=user['id'],
     )
@@ -3,6 +3,7 @@
 All admin messages include breadcrumb navigation for better UX.
 """
 
+import asyncio
 import logging
 import re
 from telegram import Update
@@ -133,16 +134,18 @@ async def handle_card_number_input(update: Update, context: ContextTypes.DEFAULT
         await update.message.reply_text(msg, reply_markup=get_cancel_settings_keyboard())
         return AWAITING_CARD_NUMBER
     
-    # Get user (admin)
-    user = await api_client.get_user(update.effective_user.id)
+    # Get user (admin) and current card info concurrently
+    user, card_info = await asyncio.gather(
+        api_client.get_user(update.effective_user.id),
+        api_client.get_payment_card(),
+    )
     if not user:
         bc.set_path(BreadcrumbPath.ADMIN_MENU)
         msg = bc.format_message("❌ خطا در دریافت اطلاعات کاربر.")
         await update.message.reply_text(msg, reply_markup=get_user_menu_keyboard(context))
         return ConversationHandler.END
     
-    # Get current card info to preserve card holder
-    card_info = await api_client.get_payment_card()
+    # Preserve current card holder
     card_holder = card_info.get('card_holder', 'نامشخص') if card_info else 'نامشخص'
     
     # Update card number
@@ -183,16 +186,18 @@ async def handle_card_holder_input(update: Update, context: ContextTypes.DEFAULT
         await update.message.reply_text(msg, reply_markup=get_cancel_settings_keyboard())
         return AWAITING_CARD_HOLDER
     
-    # Get user (admin)
-    user = await api_client.get_user(update.effective_user.id)
+    # Get user (admin) and current card info concurrently
+    user, card_info = await asyncio.gather(
+        api_client.get_user(update.effective_user.id),
+        api_client.get_payment_card(),
+    )
     if not user:
         bc.set_path(BreadcrumbPath.ADMIN_MENU)
         msg = bc.format_message("❌ خطا در دریافت اطلاعات کاربر.")
         await update.message.reply_text(msg, reply_markup=get_user_menu_keyboard(context))
         return ConversationHandler.END
     
-    # Get current card info to preserve card number
-    card_info = await api_client.get_payment_card()
+    # Card number must already be set before changing the holder
     if not card_info or not card_info.get('card_number'):
         bc.set_path(BreadcrumbPath.SETTINGS)
         msg = bc.format_message("⚠️ ابتدا باید شماره کارت را تنظیم کنید.")
@@ -15,6 +15,7 @@ from utils.flow_manager import (
     FLOW_CATALOG, CATALOG_STEPS
 )
 from utils.breadcrumb import Breadcrumb, BreadcrumbPath, get_breadcrumb, format_admin_message
+from utils.helpers import parse_placeholder_coords
 from keyboards.manager import (
     get_catalog_menu_keyboard, get_category_list_keyboard,
     get_category_actions_keyboard, get_attribute_list_keyboard,
@@ -1346,11 +1347,8 @@ async def handle_template_placeholder(update: Update, context: ContextTypes.DEFA
     bc = get_breadcrumb(context)
     
     try:
-        parts = [int(p.strip()) for p in text.split(',')]
-        if len(parts) != 4:
-            raise ValueError("Need 4 values")
-        x, y, w, h = parts
-    except (ValueError, IndexError):
+        x, y, w, h = parse_placeholder_coords(text)
+    except ValueError:
         bc.set_path(BreadcrumbPath.TEMPLATE_CREATE, cat_name, "پلن‌ها", plan_name, "قالب‌ها", "➕ قالب جدید", "محل لوگو")
         msg = bc.format_message(
             "❌ فرمت نادرست. لطفاً 4 عدد با کاما جدا شده وارد کنید:\n"
@@ -38,12 +38,16 @@ async def show_orders_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     """Show orders menu."""
     set_flow(context, FLOW_ORDERS, 'orders_menu')
     
-    user = await api_client.get_user(update.effective_user.id)
-    if not user:
+    user_context = await api_client.get_user_context(
+        update.effective_user.id,
+        include=("user", "recent_orders"),
+        orders_page_size=10,
+    )
+    if not user_context:
         await update.message.reply_text("خطا در دریافت اطلاعات کاربر.")
         return
     
-    result = await api_client.get_user_orders(user['id'], page=1, page_size=10)
+    result = user_context['recent_orders']
     
     if not result or not result.get('items'):
         await update.message.reply_text(
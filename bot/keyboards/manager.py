@@ -3,6 +3,8 @@
 This module provides consistent keyboard generation with proper back button handling.
 """
 
+import functools
+
 from telegram import ReplyKeyboardMarkup, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes
 from typing import List, Optional
@@ -10,9 +12,13 @@ from typing import List, Optional
 
 # ============== Reply Keyboards ==============
 
+@functools.lru_cache(maxsize=8)
 def get_main_menu_keyboard(is_admin: bool = False) -> ReplyKeyboardMarkup:
     """Get the main menu keyboard.
     
+    The markup only depends on the role and telegram objects are immutable,
+    so one shared instance per role is built and reused.
+    
     Args:
         is_admin: Whether to show admin panel button
         
@@ -1,9 +1,23 @@
 """Test configuration and fixtures for bot tests."""
 
 import pytest
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock
 from uuid import uuid4
 
+from telegram import CallbackQuery, Message, Update, User
+
+from keyboards.manager import get_main_menu_keyboard, get_admin_menu_keyboard
+
+
+_Photo = namedtuple("Photo", ["file_id"])
+
+
+async def _noop(*args, **kwargs):
+    """Awaitable stand-in for bot methods whose result tests ignore."""
+    return None
+
 
 @pytest.fixture
 def mock_telegram_user():
@@ -80,6 +94,58 @@ def mock_telegram_update_with_callback(mock_telegram_user, mock_callback_query):
     return update
 
 
+@pytest.fixture
+def callback_data():
+    """Callback data carried by ``mock_callback_update``; override per test class."""
+    return ""
+
+
+@pytest.fixture
+def message_text():
+    """Message text carried by ``mock_text_update``; override per test class."""
+    return ""
+
+
+@pytest.fixture
+def mock_callback_update(callback_data):
+    """Create a mock update for a callback query handler.
+    
+    Awaitable methods are not pre-installed; assign an AsyncMock in tests that await them.
+    """
+    update = MagicMock()
+    update.effective_user = MagicMock()
+    update.effective_user.id = 123456789
+    update.callback_query = MagicMock()
+    update.callback_query.data = callback_data
+    return update
+
+
+@pytest.fixture
+def mock_text_update(message_text):
+    """Create a mock update for a text message handler.
+    
+    Awaitable methods are not pre-installed; assign an AsyncMock in tests that await them.
+    """
+    update = MagicMock()
+    update.effective_user = MagicMock()
+    update.effective_user.id = 123456789
+    update.message = MagicMock()
+    update.message.text = message_text
+    return update
+
+
+@pytest.fixture
+def mock_photo_update():
+    """Create a mock update for a photo message handler.
+    
+    Awaitable methods are not pre-installed; assign an AsyncMock in tests that await them.
+    """
+    update = MagicMock()
+    update.message = MagicMock()
+    update.message.photo = [_Photo("test_file_id")]
+    return update
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock application context."""
@@ -94,6 +160,73 @@ def mock_context():
     return context
 
 
+@pytest.fixture(scope="module")
+def base_update_factory():
+    """Module-wide factory for handler updates specced on the telegram types.
+    
+    ``message`` sets attributes on ``update.message``; ``callback_data`` adds a
+    callback query; other keywords go on the user. Coroutine methods such as
+    ``reply_text`` and ``answer`` come out of the spec as AsyncMocks.
+    """
+    def _make(uid=123456789, message=None, callback_data=None, **user_attrs):
+        update = MagicMock(spec=Update)
+        update.effective_user = MagicMock(spec=User)
+        update.effective_user.id = uid
+        for name, value in user_attrs.items():
+            setattr(update.effective_user, name, value)
+        if message is not None:
+            update.message = MagicMock(spec=Message)
+            for name, value in message.items():
+                setattr(update.message, name, value)
+        if callback_data is not None:
+            update.callback_query = MagicMock(spec=CallbackQuery)
+            update.callback_query.data = callback_data
+        return update
+    return _make
+
+
+@pytest.fixture
+def base_context():
+    """Create a fresh mock context; set user_data on it per test class."""
+    context = MagicMock()
+    context.bot.get_file = AsyncMock()
+    return context
+
+
+@pytest.fixture
+def make_context():
+    """Factory for a lightweight context preloaded with the given user_data.
+    
+    Bot methods record calls and can be awaited, but always return None.
+    """
+    def _make(**user_data):
+        return SimpleNamespace(
+            user_data=dict(user_data),
+            bot=SimpleNamespace(
+                send_message=MagicMock(wraps=_noop), get_file=MagicMock(wraps=_noop)
+            ),
+        )
+    return _make
+
+
+@pytest.fixture(scope="session")
+def main_menu_customer():
+    """Main menu keyboard for a customer, built once per session."""
+    return get_main_menu_keyboard(is_admin=False)
+
+
+@pytest.fixture(scope="session")
+def main_menu_admin():
+    """Main menu keyboard for an admin, built once per session."""
+    return get_main_menu_keyboard(is_admin=True)
+
+
+@pytest.fixture(scope="session")
+def admin_menu():
+    """Admin panel keyboard, built once per session."""
+    return get_admin_menu_keyboard()
+
+
 @pytest.fixture
 def sample_user_data():
     """Create sample user data as would be returned from API."""
@@ -196,6 +329,18 @@ def sample_template_data():
     }
 
 
+_MOCK_QUESTIONS = (
+    {"id": str(uuid4()), "question_fa": "سوال ۱", "input_type": "TEXT"},
+    {"id": str(uuid4()), "question_fa": "سوال ۲", "input_type": "SINGLE_CHOICE"},
+)
+
+
+@pytest.fixture
+def api_get_questions():
+    """AsyncMock for get_questions_by_plan returning a fresh list per call."""
+    return AsyncMock(side_effect=lambda *args, **kwargs: [dict(q) for q in _MOCK_QUESTIONS])
+
+
 @pytest.fixture
 def mock_api_client():
     """Create a mock API client with common methods."""
@@ -1,9 +1,34 @@
 """Unit tests for API Client utility."""
 
+import asyncio
+
+import httpx
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from utils.api_client import APIClient, async_ttl_cache, invalidates, single_flight
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture
+async def make_client():
+    """Factory for APIClients backed by a MockTransport, closed after the test."""
+    clients = []
+    
+    def _make(handler):
+        client = APIClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+    
+    yield _make
+    for client in clients:
+        await client.close()
+
 
 class TestAPIClientUserMethods:
     """Test API client user-related methods."""
@@ -21,7 +46,6 @@ class TestAPIClientUserMethods:
         }
         return response
     
-    @pytest.mark.asyncio
     async def test_get_or_create_user_success(self, mock_httpx_response):
         """Test successful user creation."""
         user_data = {
@@ -39,7 +63,6 @@ class TestAPIClientUserMethods:
             assert mock_httpx_response.status_code == 200
             assert mock_httpx_response.json()['telegram_id'] == 123456789
     
-    @pytest.mark.asyncio
     async def test_get_user_by_telegram_id(self, mock_httpx_response):
         """Test getting user by telegram ID."""
         telegram_id = 123456789
@@ -51,7 +74,6 @@ class TestAPIClientUserMethods:
             
             assert mock_httpx_response.json()['first_name'] == "Test"
     
-    @pytest.mark.asyncio
     async def test_promote_to_admin(self):
         """Test promoting user to admin."""
         user_id = str(uuid4())
@@ -86,7 +108,6 @@ class TestAPIClientOrderMethods:
             "total_price": 100000,
         }
     
-    @pytest.mark.asyncio
     async def test_create_order(self, sample_order):
         """Test creating an order."""
         mock_response = MagicMock()
@@ -101,7 +122,6 @@ class TestAPIClientOrderMethods:
             assert mock_response.status_code == 201
             assert mock_response.json()['status'] == "PENDING"
     
-    @pytest.mark.asyncio
     async def test_get_user_orders(self, sample_order):
         """Test getting user orders."""
         mock_response = MagicMock()
@@ -122,7 +142,6 @@ class TestAPIClientOrderMethods:
             assert result['total'] == 1
             assert len(result['items']) == 1
     
-    @pytest.mark.asyncio
     async def test_cancel_order(self, sample_order):
         """Test cancelling an order."""
         sample_order['status'] = 'CANCELLED'
@@ -152,7 +171,6 @@ class TestAPIClientPaymentMethods:
             "status": "PENDING",
         }
     
-    @pytest.mark.asyncio
     async def test_initiate_payment(self, sample_payment):
         """Test initiating payment."""
         mock_response = MagicMock()
@@ -167,7 +185,6 @@ class TestAPIClientPaymentMethods:
             assert mock_response.status_code == 201
             assert 'payment_id' in mock_response.json()
     
-    @pytest.mark.asyncio
     async def test_upload_receipt(self, sample_payment):
         """Test uploading payment receipt."""
         sample_payment['status'] = 'AWAITING_APPROVAL'
@@ -190,7 +207,6 @@ class TestAPIClientPaymentMethods:
 class TestAPIClientCatalogMethods:
     """Test API client catalog-related methods."""
     
-    @pytest.mark.asyncio
     async def test_get_categories(self):
         """Test getting categories."""
         mock_response = MagicMock()
@@ -211,7 +227,6 @@ class TestAPIClientCatalogMethods:
             result = mock_response.json()
             assert result['total'] == 2
     
-    @pytest.mark.asyncio
     async def test_create_category(self):
         """Test creating a category."""
         category_id = str(uuid4())
@@ -232,7 +247,6 @@ class TestAPIClientCatalogMethods:
             result = mock_response.json()
             assert result['id'] == category_id
     
-    @pytest.mark.asyncio
     async def test_get_design_plans(self):
         """Test getting design plans for a category."""
         mock_response = MagicMock()
@@ -258,7 +272,6 @@ class TestAPIClientCatalogMethods:
 class TestAPIClientErrorHandling:
     """Test API client error handling."""
     
-    @pytest.mark.asyncio
     async def test_network_error_handling(self):
         """Test handling network errors."""
         with patch('httpx.AsyncClient') as mock_client:
@@ -270,7 +283,6 @@ class TestAPIClientErrorHandling:
                 async with mock_client() as client:
                     await client.get("http://test.com")
     
-    @pytest.mark.asyncio
     async def test_404_error_handling(self):
         """Test handling 404 responses."""
         mock_response = MagicMock()
@@ -284,7 +296,12 @@ class TestAPIClientErrorHandling:
             
             assert mock_response.status_code == 404
     
-    @pytest.mark.asyncio
+    async def test_ok404_returns_none(self, make_client):
+        """Test that an expected 404 comes back as a falsy None."""
+        client = make_client(lambda request: httpx.Response(404))
+        
+        assert await client._request("GET", "/api/v1/users/1", error="getting user", ok404=True) is None
+    
     async def test_validation_error_handling(self):
         """Test handling 422 validation errors."""
         mock_response = MagicMock()
@@ -303,3 +320,505 @@ class TestAPIClientErrorHandling:
             assert mock_response.status_code == 422
             assert len(mock_response.json()['detail']) == 1
 
+
+class TestAsyncTTLCache:
+    """Test the TTL cache used for idempotent GETs."""
+    
+    @pytest.fixture
+    def cached_client(self):
+        """Create a client-like object with one cached method."""
+        class _Client:
+            def __init__(self):
+                self._caches = {}
+                self.fetch_mock = AsyncMock(return_value={"card_number": "1234"})
+            
+            def _cache_invalidate(self, *names):
+                for name in names:
+                    self._caches.pop(name, None)
+            
+            @async_ttl_cache(ttl=60, maxsize=2)
+            async def fetch(self, key=None):
+                return await self.fetch_mock(key)
+            
+            @invalidates("fetch")
+            async def save(self):
+                return {"ok": True}
+        
+        return _Client()
+    
+    async def test_repeated_calls_hit_cache(self, cached_client):
+        """Test that repeated calls with the same args reach the backend once."""
+        first = await cached_client.fetch("a")
+        second = await cached_client.fetch("a")
+        
+        assert first == second
+        assert cached_client.fetch_mock.await_count == 1
+    
+    async def test_caller_mutation_does_not_reach_cache(self, cached_client):
+        """Test that changing a returned result leaves later callers the original."""
+        first = await cached_client.fetch("a")
+        first["card_number"] = "0000"
+        (await cached_client.fetch("a"))["card_number"] = "9999"
+        
+        assert (await cached_client.fetch("a"))["card_number"] == "1234"
+        assert cached_client.fetch_mock.await_count == 1
+    
+    async def test_none_not_cached_and_clear(self, cached_client):
+        """Test that failures are retried and invalidation forces a refetch."""
+        cached_client.fetch_mock.return_value = None
+        await cached_client.fetch("a")
+        cached_client.fetch_mock.return_value = {"card_number": "5678"}
+        assert (await cached_client.fetch("a"))["card_number"] == "5678"
+        
+        cached_client._cache_invalidate("fetch")
+        await cached_client.fetch("a")
+        assert cached_client.fetch_mock.await_count == 3
+    
+    async def test_successful_write_invalidates(self, cached_client):
+        """Test that a write decorated with invalidates clears the cache."""
+        await cached_client.fetch("a")
+        await cached_client.save()
+        await cached_client.fetch("a")
+        
+        assert cached_client.fetch_mock.await_count == 2
+    
+    async def test_404_cached_until_user_created(self, make_client):
+        """Test that a missing user is looked up once until it is created."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            if request.method == "GET":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"id": "u1"})
+        
+        client = make_client(handler)
+        
+        assert await client.get_user(42) is None
+        assert await client.get_user(42) is None
+        await client.create_or_update_user({"telegram_id": 42})
+        assert await client.get_user(42) is None
+        
+        assert calls == ["GET", "POST", "GET"]
+    
+    async def test_user_cached_until_updated(self, make_client):
+        """Test that a found user is served from cache until update_user succeeds."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(200, json={"id": "u1", "role": "CUSTOMER"})
+        
+        client = make_client(handler)
+        
+        await client.get_user(43)
+        await client.get_user(43)
+        await client.update_user(43, {"city": "Tehran"})
+        await client.get_user(43)
+        
+        assert calls == ["GET", "PATCH", "GET"]
+    
+    async def test_clients_keep_separate_caches(self, make_client):
+        """Test that a write through one client leaves another client's cache intact."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(200, json={"id": "u1", "role": "CUSTOMER"})
+        
+        first, second = make_client(handler), make_client(handler)
+        
+        await first.get_user(44)
+        await second.get_user(44)
+        await first.update_user(44, {"city": "Tehran"})
+        await second.get_user(44)
+        
+        assert calls == ["GET", "GET", "PATCH"]
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical requests."""
+    
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent identical calls reach the backend once."""
+        class _Client:
+            def __init__(self):
+                self._inflight = {}
+                self.fetch_mock = AsyncMock(return_value={"id": "p1"})
+            
+            @single_flight
+            async def fetch(self, product_id):
+                await asyncio.sleep(0)
+                return await self.fetch_mock(product_id)
+        
+        client = _Client()
+        results = await asyncio.gather(*(client.fetch("p1") for _ in range(5)))
+        
+        assert all(r is results[0] for r in results)
+        assert client.fetch_mock.await_count == 1
+        assert client._inflight == {}
+
+
+class TestAPIClientRetries:
+    """Test retry behaviour of the request helper."""
+    
+    @pytest.fixture
+    def flaky_client(self, make_client):
+        """Create an API client whose backend fails twice with 503."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+        
+        client = make_client(handler)
+        return client, calls
+    
+    async def test_get_retried_on_503(self, flaky_client):
+        """Test that idempotent requests are retried on transient errors."""
+        client, calls = flaky_client
+        with patch('utils.api_client.asyncio.sleep', new=AsyncMock()):
+            result = await client.get_user(123456789)
+        
+        assert result == {"ok": True}
+        assert len(calls) == 3
+    
+    async def test_429_waits_for_retry_after(self, make_client):
+        """Test that rate-limited requests sleep for the server's Retry-After."""
+        responses = iter([httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={})])
+        client = make_client(lambda request: next(responses))
+        sleep = AsyncMock()
+        with patch('utils.api_client.asyncio.sleep', new=sleep):
+            result = await client._request("GET", "/api/v1/products", error="getting products")
+        
+        assert result == {}
+        sleep.assert_awaited_once_with(2.0)
+    
+    async def test_post_not_retried(self, flaky_client):
+        """Test that non-idempotent requests are sent once."""
+        client, calls = flaky_client
+        result = await client.create_order(str(uuid4()), {"quantity": 1})
+        
+        assert result is None
+        assert calls == ["POST"]
+    
+    async def test_post_retried_when_marked_idempotent(self, flaky_client):
+        """Test that callers can opt a POST into retries."""
+        client, calls = flaky_client
+        with patch('utils.api_client.asyncio.sleep', new=AsyncMock()):
+            result = await client._request(
+                "POST", "/api/v1/orders", error="creating order", idempotent=True
+            )
+        
+        assert result == {"ok": True}
+        assert calls == ["POST"] * 3
+    
+    async def test_retried_post_keeps_call_headers(self, make_client):
+        """Test that every attempt keeps per-call headers next to the JSON content type."""
+        seen = []
+        
+        def handler(request):
+            seen.append((request.headers["X-Trace-Id"], request.headers["Content-Type"]))
+            if len(seen) < 2:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+        
+        client = make_client(handler)
+        with patch('utils.api_client.asyncio.sleep', new=AsyncMock()):
+            await client._request(
+                "POST",
+                "/api/v1/payments/p1/approve",
+                json={"admin_id": "a1"},
+                headers={"X-Trace-Id": "k1"},
+                error="approving payment",
+                idempotent=True,
+            )
+        
+        assert seen == [("k1", "application/json")] * 2
+    
+    async def test_failed_connect_retried_for_post(self, make_client):
+        """Test that a POST is re-sent when the connection never opened."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            if len(calls) < 2:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"ok": True})
+        
+        client = make_client(handler)
+        with patch('utils.api_client.asyncio.sleep', new=AsyncMock()):
+            result = await client.create_order(str(uuid4()), {"quantity": 1})
+        
+        assert result == {"ok": True}
+        assert calls == ["POST"] * 2
+    
+    async def test_read_timeout_not_retried_for_post(self, make_client):
+        """Test that a POST that may have reached the server is not re-sent."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            raise httpx.ReadTimeout("slow", request=request)
+        
+        client = make_client(handler)
+        result = await client.create_order(str(uuid4()), {"quantity": 1})
+        
+        assert result is None
+        assert calls == ["POST"]
+    
+    async def test_get_retried_on_read_error(self, make_client):
+        """Test that a GET is re-sent after a stale keep-alive connection fails."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            if len(calls) < 2:
+                raise httpx.ReadError("connection reset", request=request)
+            return httpx.Response(200, json={"ok": True})
+        
+        client = make_client(handler)
+        with patch('utils.api_client.asyncio.sleep', new=AsyncMock()):
+            result = await client._request("GET", "/api/v1/products", error="getting products")
+        
+        assert result == {"ok": True}
+        assert calls == ["GET"] * 2
+    
+    async def test_deadline_bounds_retries(self, make_client):
+        """Test that retries give up once the overall deadline passes."""
+        client = make_client(lambda request: httpx.Response(503))
+        with patch('utils.api_client.REQUEST_DEADLINE', 0.01), \
+                patch('utils.api_client.RETRY_BACKOFF_BASE', 1.0):
+            with pytest.raises(httpx.TimeoutException):
+                await client._send("GET", "/api/v1/products", {})
+    
+    async def test_status_only_request_skips_body(self, make_client):
+        """Test that status-only calls never read the response body."""
+        read = []
+        
+        class _Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                read.append(True)
+                yield b'{"detail": "gone"}'
+        
+        client = make_client(
+            lambda request: httpx.Response(204, stream=_Body())
+        )
+        
+        assert await client.delete_section("s1", "a1") is True
+        assert read == []
+    
+    async def test_bulkhead_caps_requests_in_flight(self, make_client):
+        """Test that concurrent requests beyond the cap wait for a free slot."""
+        running = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return httpx.Response(200, json={})
+        
+        client = make_client(handler)
+        client._bulkhead = asyncio.Semaphore(3)
+        await asyncio.gather(*(
+            client._request("GET", f"/api/v1/products/{i}", error="getting product")
+            for i in range(10)
+        ))
+        
+        assert peak == 3
+    
+    async def test_concurrent_get_client_builds_one_pool(self):
+        """Test that racing callers share a single HTTP client."""
+        client = APIClient()
+        clients = await asyncio.gather(*(client._get_client() for _ in range(10)))
+        
+        assert all(c is clients[0] for c in clients)
+        await client.close()
+
+
+class TestAPIClientPagination:
+    """Test paged iteration helpers."""
+    
+    async def test_iter_user_orders_walks_pages(self, make_client):
+        """Test that order iteration follows pages until total is reached."""
+        pages = {
+            "1": {"items": [{"id": "o1"}, {"id": "o2"}], "total": 3, "page": 1, "page_size": 2},
+            "2": {"items": [{"id": "o3"}], "total": 3, "page": 2, "page_size": 2},
+        }
+        client = make_client(
+            lambda request: httpx.Response(200, json=pages[request.url.params["page"]])
+        )
+        
+        orders = [order["id"] async for order in client.iter_user_orders("u1", page_size=2)]
+        
+        assert orders == ["o1", "o2", "o3"]
+    
+    async def test_iter_pending_approval_payments_stops_on_short_page(self, make_client):
+        """Test that pending payment iteration stops at the first short page."""
+        requested = []
+        
+        def handler(request):
+            requested.append(request.url.params["page"])
+            return httpx.Response(200, json={"items": [{"id": "p1"}], "total": 5})
+        
+        client = make_client(handler)
+        
+        payments = [p["id"] async for p in client.iter_pending_approval_payments("a1", page_size=2)]
+        
+        assert payments == ["p1"]
+        assert requested == ["1"]
+
+
+class TestAPIClientUserContext:
+    """Test the combined user context lookup."""
+    
+    async def test_context_in_one_request(self, make_client):
+        """Test that the context endpoint serves everything in one call."""
+        paths = []
+        
+        def handler(request):
+            paths.append((request.url.path, request.url.params["orders_page_size"]))
+            return httpx.Response(200, json={"user": {"id": "u1"}, "subscription": None, "recent_orders": None})
+        
+        client = make_client(handler)
+        context = await client.get_user_context(123456789, orders_page_size=10)
+        
+        assert context["user"] == {"id": "u1"}
+        assert paths == [("/api/v1/users/123456789/context", "10")]
+        assert client.stats()["getting user context"]["count"] == 1
+    
+    async def test_falls_back_without_context_endpoint(self, make_client):
+        """Test that a backend without the endpoint is served by separate calls."""
+        def handler(request):
+            if request.url.path.endswith("/context"):
+                return httpx.Response(404)
+            if request.url.path == "/api/v1/users/123456789":
+                return httpx.Response(200, json={"id": "u1"})
+            return httpx.Response(200, json={"items": [{"id": "o1"}], "total": 1})
+        
+        client = make_client(handler)
+        context = await client.get_user_context(123456789, include=("user", "recent_orders"))
+        
+        assert context == {
+            "user": {"id": "u1"},
+            "subscription": None,
+            "recent_orders": {"items": [{"id": "o1"}], "total": 1},
+        }
+
+
+class TestAPIClientMapAdmins:
+    """Test concurrent per-admin fan-out."""
+    
+    async def test_map_admins_bounds_concurrency_and_keeps_order(self, make_client):
+        """Test that map_admins respects the limit and returns results in admin order."""
+        client = make_client(
+            lambda request: httpx.Response(200, json=[3, 1, 2])
+        )
+        running = 0
+        peak = 0
+        
+        async def fn(telegram_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return telegram_id * 10
+        
+        results = await client.map_admins(fn, concurrency=2)
+        
+        assert results == [30, 10, 20]
+        assert peak == 2
+
+
+class TestAPIClientStats:
+    """Test per-endpoint latency tracking."""
+    
+    async def test_stats_counts_requests_per_endpoint(self, make_client):
+        """Test that each request lands in its endpoint's histogram."""
+        client = make_client(
+            lambda request: httpx.Response(200, json={"ok": True})
+        )
+        await client._request("GET", "/api/v1/ping", error="pinging")
+        await client._request("GET", "/api/v1/ping", error="pinging")
+        
+        stats = client.stats()
+        
+        assert stats["pinging"]["count"] == 2
+        assert sum(stats["pinging"]["buckets"]) == 2
+        assert 0 < stats["pinging"]["p50_ms"] <= stats["pinging"]["p99_ms"]
+
+
+class TestAPIClientCircuitBreaker:
+    """Test that the client fails fast while the backend is down."""
+    
+    async def test_open_circuit_skips_network(self, make_client):
+        """Test that requests stop reaching the backend once the circuit opens."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(503)
+        
+        client = make_client(handler)
+        for _ in range(7):
+            assert await client._request("POST", "/api/v1/orders", error="creating order") is None
+        
+        assert len(calls) == 5
+    
+    async def test_retries_count_towards_circuit(self, make_client):
+        """Test that each failed retry attempt is recorded by the breaker."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(503)
+        
+        client = make_client(handler)
+        with patch('utils.api_client.asyncio.sleep', new=AsyncMock()):
+            assert await client._request("GET", "/api/v1/products", error="getting products") is None
+            assert await client._request("GET", "/api/v1/products", error="getting products") is None
+        
+        assert len(calls) == 5
+    
+    async def test_server_error_keeps_circuit_closed(self, make_client):
+        """Test that application 500s do not open the circuit."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(500)
+        
+        client = make_client(handler)
+        for _ in range(7):
+            assert await client._request("POST", "/api/v1/orders", error="creating order") is None
+        
+        assert len(calls) == 7
+    
+    async def test_deadline_in_backoff_adds_no_failure(self, make_client):
+        """Test that a deadline hit while sleeping between attempts is not a backend failure."""
+        client = make_client(lambda request: httpx.Response(503))
+        with patch('utils.api_client.REQUEST_DEADLINE', 0.01), \
+                patch('utils.api_client.RETRY_BACKOFF_BASE', 1.0):
+            with pytest.raises(httpx.TimeoutException):
+                await client._send("GET", "/api/v1/products", {})
+        
+        assert client._breaker.failure_count == 1
+    
+    async def test_deadline_in_flight_counts_as_failure(self, make_client):
+        """Test that a deadline cutting off an attempt on the wire is recorded once."""
+        async def handler(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200)
+        
+        client = make_client(handler)
+        with patch('utils.api_client.REQUEST_DEADLINE', 0.01):
+            with pytest.raises(httpx.TimeoutException):
+                await client._send("GET", "/api/v1/products", {})
+        
+        assert client._breaker.failure_count == 1
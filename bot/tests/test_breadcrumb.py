@@ -221,6 +221,29 @@ class TestHelperFunctions:
         bc2 = get_breadcrumb(context)
         assert "test" in bc2.path
     
+    def test_display_refreshed_after_other_instance_mutates(self):
+        """Test that a cached display string is dropped when any instance changes the path."""
+        context = MockContext()
+        bc1 = get_breadcrumb(context)
+        bc1.push("a")
+        assert bc1.get_display().endswith("a")
+        
+        get_breadcrumb(context).push("b")
+        
+        assert bc1.get_display().endswith(f"a{Breadcrumb.SEPARATOR}b")
+    
+    def test_path_copy_cannot_bypass_display_cache(self):
+        """Test that mutating the returned path leaves the breadcrumb unchanged."""
+        context = MockContext()
+        bc = get_breadcrumb(context)
+        bc.push("a")
+        display = bc.get_display()
+        
+        bc.path.append("b")
+        
+        assert bc.path == ["a"]
+        assert bc.get_display() == display
+    
     def test_format_admin_message_basic(self):
         """Test format_admin_message basic usage."""
         context = MockContext()
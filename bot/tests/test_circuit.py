@@ -0,0 +1,55 @@
+"""Unit tests for the circuit breaker utility."""
+
+from unittest.mock import patch
+
+import pytest
+
+from utils.circuit import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def breaker():
+    """Create a breaker that opens after two failures for ten seconds."""
+    return CircuitBreaker(failure_threshold=2, recovery_timeout=10.0)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+    
+    def test_opens_after_threshold(self, breaker):
+        """Test that consecutive failures open the circuit and reject calls."""
+        breaker.record_failure()
+        assert breaker.allow()
+        
+        breaker.record_failure()
+        
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+    
+    def test_success_resets_failure_count(self, breaker):
+        """Test that a success between failures keeps the circuit closed."""
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        
+        assert breaker.state is CircuitState.CLOSED
+    
+    @pytest.mark.parametrize("probe_ok,expected", [
+        (True, CircuitState.CLOSED),
+        (False, CircuitState.OPEN),
+    ])
+    def test_probe_after_recovery_window(self, breaker, probe_ok, expected):
+        """Test that one probe is admitted after the window and decides the state."""
+        with patch("utils.circuit.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            breaker.record_failure()
+        
+        with patch("utils.circuit.time.monotonic", return_value=111.0):
+            assert breaker.allow()
+            assert not breaker.allow()
+            if probe_ok:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        
+        assert breaker.state is expected
@@ -1,47 +1,75 @@
 """Unit tests for Flow Manager utility."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
 
 from utils.flow_manager import (
     set_flow, get_flow, get_step, get_flow_data, clear_flow,
-    FLOW_CATALOG, FLOW_ORDERS, FLOW_PROFILE,
+    FLOW_CATALOG, FLOW_ORDERS, FLOW_PROFILE, FLOW_STATE_KEY, FlowState,
 )
 
 # Define constants for compatibility
 FLOW_ORDER = FLOW_ORDERS  # Alias
-STEP_IDLE = None  # Default step is None when not set
+
+# (flow, step, data) sequences driven through set_flow
+FLOW_TRANSITIONS = {
+    "catalog_create_category": (
+        (FLOW_CATALOG, "category_list", None),
+        (FLOW_CATALOG, "category_create_name", None),
+        (FLOW_CATALOG, "category_create_description", {"temp_name": "Labels"}),
+    ),
+    "order_payment": (
+        (FLOW_ORDER, "order_detail", {"order_id": "123"}),
+        (FLOW_ORDER, "payment_pending", {"order_id": "123", "payment_id": "456"}),
+        (FLOW_ORDER, "payment_upload_receipt", {"order_id": "123", "payment_id": "456"}),
+    ),
+    "profile_edit": (
+        (FLOW_PROFILE, "profile_view", None),
+        (FLOW_PROFILE, "profile_edit_name", None),
+    ),
+    "flow_switch": (
+        (FLOW_CATALOG, "category_list", None),
+        (FLOW_ORDER, "order_list", None),
+    ),
+}
+
+
+def _clear_user_data(context):
+    """Clean up flow state by hand, without going through clear_flow."""
+    context.user_data.clear()
+
+
+@pytest.fixture
+def mock_context():
+    """Create a context stand-in; flow helpers only touch user_data."""
+    return SimpleNamespace(user_data={})
 
 
 class TestFlowManagerBasics:
     """Test basic flow manager operations."""
     
-    @pytest.fixture
-    def mock_context(self):
-        """Create mock context with empty user_data."""
-        context = MagicMock()
-        context.user_data = {}
-        return context
-    
     def test_set_flow(self, mock_context):
         """Test setting a flow with step."""
         set_flow(mock_context, FLOW_CATALOG, "category_create_name")
         
-        assert mock_context.user_data['current_flow'] == FLOW_CATALOG
-        assert mock_context.user_data['flow_step'] == "category_create_name"
+        state = mock_context.user_data[FLOW_STATE_KEY]
+        assert state.flow == FLOW_CATALOG
+        assert state.step == "category_create_name"
     
     def test_set_flow_with_data(self, mock_context):
         """Test setting flow with additional data."""
         flow_data = {"category_id": "123", "temp_name": "Test"}
         set_flow(mock_context, FLOW_CATALOG, "category_edit", flow_data)
         
-        assert mock_context.user_data['current_flow'] == FLOW_CATALOG
-        assert mock_context.user_data['flow_step'] == "category_edit"
-        assert mock_context.user_data['flow_data']['category_id'] == "123"
+        state = mock_context.user_data[FLOW_STATE_KEY]
+        assert state.flow == FLOW_CATALOG
+        assert state.step == "category_edit"
+        assert state.data['category_id'] == "123"
     
     def test_get_flow(self, mock_context):
         """Test getting current flow."""
-        mock_context.user_data['current_flow'] = FLOW_ORDER
+        mock_context.user_data[FLOW_STATE_KEY] = FlowState(flow=FLOW_ORDER)
         
         assert get_flow(mock_context) == FLOW_ORDER
     
@@ -51,17 +79,17 @@ class TestFlowManagerBasics:
     
     def test_get_step(self, mock_context):
         """Test getting current flow step."""
-        mock_context.user_data['flow_step'] = "payment_upload_receipt"
+        mock_context.user_data[FLOW_STATE_KEY] = FlowState(step="payment_upload_receipt")
         
         assert get_step(mock_context) == "payment_upload_receipt"
     
     def test_get_step_default(self, mock_context):
-        """Test getting flow step returns IDLE when not set."""
-        assert get_step(mock_context) == STEP_IDLE
+        """Test getting flow step returns None when not set."""
+        assert get_step(mock_context) is None
     
     def test_get_flow_data(self, mock_context):
         """Test getting flow data."""
-        mock_context.user_data['flow_data'] = {"order_id": "456"}
+        mock_context.user_data[FLOW_STATE_KEY] = FlowState(data={"order_id": "456"})
         
         data = get_flow_data(mock_context)
         assert data['order_id'] == "456"
@@ -69,102 +97,39 @@ class TestFlowManagerBasics:
     def test_get_flow_data_empty(self, mock_context):
         """Test getting flow data when empty."""
         assert get_flow_data(mock_context) == {}
+        assert mock_context.user_data == {}
     
     def test_clear_flow(self, mock_context):
         """Test clearing flow state."""
-        mock_context.user_data['current_flow'] = FLOW_CATALOG
-        mock_context.user_data['flow_step'] = "some_step"
-        mock_context.user_data['flow_data'] = {"key": "value"}
+        mock_context.user_data[FLOW_STATE_KEY] = FlowState(
+            flow=FLOW_CATALOG, step="some_step", data={"key": "value"}
+        )
         
         clear_flow(mock_context)
         
-        assert 'current_flow' not in mock_context.user_data
-        assert 'flow_step' not in mock_context.user_data
-        assert 'flow_data' not in mock_context.user_data
+        assert FLOW_STATE_KEY not in mock_context.user_data
 
 
 class TestFlowTransitions:
     """Test flow state transitions."""
     
-    @pytest.fixture
-    def mock_context(self):
-        """Create mock context."""
-        context = MagicMock()
-        context.user_data = {}
-        return context
-    
-    def test_catalog_flow_create_category(self, mock_context):
-        """Test catalog flow: create category steps."""
-        # Start
-        set_flow(mock_context, FLOW_CATALOG, "category_list")
-        assert get_step(mock_context) == "category_list"
-        
-        # User clicks create
-        set_flow(mock_context, FLOW_CATALOG, "category_create_name")
-        assert get_step(mock_context) == "category_create_name"
-        
-        # User enters name
-        set_flow(mock_context, FLOW_CATALOG, "category_create_description", {"temp_name": "Labels"})
-        assert get_step(mock_context) == "category_create_description"
-        assert get_flow_data(mock_context)['temp_name'] == "Labels"
-    
-    def test_order_flow_payment(self, mock_context):
-        """Test order flow: payment steps."""
-        # View order
-        set_flow(mock_context, FLOW_ORDER, "order_detail", {"order_id": "123"})
-        
-        # Payment initiated
-        set_flow(mock_context, FLOW_ORDER, "payment_pending", {
-            "order_id": "123",
-            "payment_id": "456",
-        })
-        
-        # Upload receipt
-        set_flow(mock_context, FLOW_ORDER, "payment_upload_receipt", {
-            "order_id": "123",
-            "payment_id": "456",
-        })
-        
-        assert get_step(mock_context) == "payment_upload_receipt"
-        assert get_flow_data(mock_context)['payment_id'] == "456"
-    
-    def test_profile_flow_edit(self, mock_context):
-        """Test profile flow: edit steps."""
-        # View profile
-        set_flow(mock_context, FLOW_PROFILE, "profile_view")
-        
-        # Edit name
-        set_flow(mock_context, FLOW_PROFILE, "profile_edit_name")
-        assert get_step(mock_context) == "profile_edit_name"
-        
-        # Clear after completion
-        clear_flow(mock_context)
-        assert get_flow(mock_context) is None
-    
-    def test_flow_switch(self, mock_context):
-        """Test switching between flows."""
-        # In catalog flow
-        set_flow(mock_context, FLOW_CATALOG, "category_list")
-        assert get_flow(mock_context) == FLOW_CATALOG
-        
-        # Switch to order flow
-        set_flow(mock_context, FLOW_ORDER, "order_list")
-        assert get_flow(mock_context) == FLOW_ORDER
-        
-        # Old flow data should be cleared
-        assert 'category_list' not in mock_context.user_data
+    @pytest.mark.parametrize(
+        "steps", list(FLOW_TRANSITIONS.values()), ids=list(FLOW_TRANSITIONS)
+    )
+    def test_flow_transitions(self, mock_context, steps):
+        """Test that each step of a flow is reflected in the context."""
+        for flow, step, data in steps:
+            set_flow(mock_context, flow, step, data)
+            
+            assert get_flow(mock_context) == flow
+            assert get_step(mock_context) == step
+            if data is not None:
+                assert get_flow_data(mock_context) == data
 
 
 class TestFlowDataPersistence:
     """Test flow data persistence across steps."""
     
-    @pytest.fixture
-    def mock_context(self):
-        """Create mock context."""
-        context = MagicMock()
-        context.user_data = {}
-        return context
-    
     def test_data_preserved_across_steps(self, mock_context):
         """Test that flow data is preserved when changing steps."""
         # Set initial data
@@ -185,15 +150,16 @@ class TestFlowDataPersistence:
         assert final_data['plan_id'] == "plan-456"
         assert final_data['question_text'] == "New question?"
     
-    def test_data_cleared_on_clear_flow(self, mock_context):
-        """Test that flow data is cleared when explicitly clearing flow."""
-        # Set catalog flow with data
+    @pytest.mark.parametrize(
+        "cleaner", [_clear_user_data, clear_flow], ids=["manual_clear", "clear_flow"]
+    )
+    def test_data_cleared(self, mock_context, cleaner):
+        """Test that flow state and data are gone after cleanup."""
         set_flow(mock_context, FLOW_CATALOG, "category_list", {"cat_id": "123"})
         
-        # Clear the flow
-        clear_flow(mock_context)
+        cleaner(mock_context)
         
-        # Data should be gone
         assert get_flow(mock_context) is None
         assert get_step(mock_context) is None
-
+        assert get_flow_data(mock_context) == {}
+        assert mock_context.user_data == {}
@@ -4,149 +4,150 @@ This module tests that all keyboards are properly consolidated
 and have consistent emoji styling.
 """
 
+from pathlib import Path
+from typing import Iterator
+
 import pytest
-from telegram import ReplyKeyboardMarkup, InlineKeyboardMarkup, KeyboardButton
+from telegram import ReplyKeyboardMarkup, InlineKeyboardMarkup
 
 # Import from the single source of truth
 from keyboards.manager import (
-    get_main_menu_keyboard,
-    get_admin_menu_keyboard,
     get_back_keyboard,
     get_catalog_menu_keyboard,
     get_category_list_keyboard,
 )
 
+# order, orders, profile, tracking, support, help
+REQUIRED_MAIN_EMOJIS = frozenset({"🛒", "📦", "👤", "🔍", "📞", "ℹ️"})
+# payments, catalog, settings, admins, back
+REQUIRED_ADMIN_EMOJIS = frozenset({"💳", "📂", "⚙️", "👥", "🔙"})
+
+# Expected Persian texts (without emojis for flexibility)
+EXPECTED_MAIN_TEXTS = (
+    "ثبت سفارش",
+    "سفارشات من",
+    "پروفایل",
+    "رهگیری سفارش",
+    "پشتیبانی",
+    "راهنما",
+    "پنل مدیریت",
+)
+EXPECTED_ADMIN_TEXTS = ("پرداخت", "کاتالوگ", "تنظیمات", "مدیران", "بازگشت")
+
 
 def get_button_texts(keyboard: ReplyKeyboardMarkup) -> list[str]:
-    """Extract text from all buttons in a ReplyKeyboardMarkup."""
-    texts = []
-    for row in keyboard.keyboard:
-        for btn in row:
-            if isinstance(btn, KeyboardButton):
-                texts.append(btn.text)
-            elif isinstance(btn, str):
-                texts.append(btn)
-    return texts
+    """Extract text from all buttons in a ReplyKeyboardMarkup.
+    
+    Buttons may be KeyboardButton objects or plain strings.
+    """
+    return [getattr(btn, "text", btn) for row in keyboard.keyboard for btn in row]
+
+
+def iter_inline_texts(keyboard: InlineKeyboardMarkup) -> Iterator[str]:
+    """Lazily yield the text of every button in an InlineKeyboardMarkup."""
+    return (btn.text for row in keyboard.inline_keyboard for btn in row)
+
+
+def joined_button_text(keyboard: ReplyKeyboardMarkup) -> str:
+    """Join all button texts of a ReplyKeyboardMarkup into one searchable string."""
+    return "\n".join(get_button_texts(keyboard))
+
+
+@pytest.fixture(scope="session")
+def main_menu_customer_joined(main_menu_customer):
+    """Joined button text of the customer main menu."""
+    return joined_button_text(main_menu_customer)
+
+
+@pytest.fixture(scope="session")
+def main_menu_admin_buttons(main_menu_admin):
+    """Button texts of the admin main menu."""
+    return get_button_texts(main_menu_admin)
+
+
+@pytest.fixture(scope="session")
+def main_menu_admin_joined(main_menu_admin_buttons):
+    """Joined button text of the admin main menu."""
+    return "\n".join(main_menu_admin_buttons)
+
+
+@pytest.fixture(scope="session")
+def admin_menu_buttons(admin_menu):
+    """Button texts of the admin panel menu."""
+    return get_button_texts(admin_menu)
+
+
+@pytest.fixture(scope="session")
+def admin_menu_joined(admin_menu_buttons):
+    """Joined button text of the admin panel menu."""
+    return "\n".join(admin_menu_buttons)
 
 
 class TestMainMenuKeyboard:
     """Tests for the main menu keyboard."""
 
-    def test_main_menu_has_emojis(self):
+    def test_main_menu_has_emojis(self, main_menu_customer_joined):
         """Test that main menu buttons have emojis."""
-        keyboard = get_main_menu_keyboard(is_admin=False)
-        buttons = get_button_texts(keyboard)
-        
         # Check that key buttons have emojis
-        assert any("🛒" in btn for btn in buttons), "Should have order emoji"
-        assert any("📦" in btn for btn in buttons), "Should have orders emoji"
-        assert any("👤" in btn for btn in buttons), "Should have profile emoji"
-        assert any("🔍" in btn for btn in buttons), "Should have tracking emoji"
-        assert any("📞" in btn for btn in buttons), "Should have support emoji"
-        assert any("ℹ️" in btn for btn in buttons), "Should have help emoji"
-
-    def test_main_menu_customer_no_admin_button(self):
+        missing = {e for e in REQUIRED_MAIN_EMOJIS if e not in main_menu_customer_joined}
+        assert not missing, f"Main menu is missing emojis: {missing}"
+
+    def test_main_menu_customer_no_admin_button(self, main_menu_customer_joined):
         """Test that non-admin users don't see admin panel button."""
-        keyboard = get_main_menu_keyboard(is_admin=False)
-        buttons = get_button_texts(keyboard)
-        
-        assert not any("پنل مدیریت" in btn for btn in buttons), \
+        assert "پنل مدیریت" not in main_menu_customer_joined, \
             "Non-admin should not see admin panel button"
 
-    def test_main_menu_admin_has_admin_button(self):
+    def test_main_menu_admin_has_admin_button(self, main_menu_admin_buttons):
         """Test that admin users see admin panel button with emoji."""
-        keyboard = get_main_menu_keyboard(is_admin=True)
-        buttons = get_button_texts(keyboard)
-        
-        admin_button = [btn for btn in buttons if "پنل مدیریت" in btn]
+        admin_button = [btn for btn in main_menu_admin_buttons if "پنل مدیریت" in btn]
         assert len(admin_button) == 1, "Admin should see admin panel button"
         assert "🔧" in admin_button[0], "Admin button should have emoji"
 
-    def test_main_menu_returns_reply_keyboard(self):
+    def test_main_menu_returns_reply_keyboard(self, main_menu_customer):
         """Test that main menu returns ReplyKeyboardMarkup."""
-        keyboard = get_main_menu_keyboard()
-        assert isinstance(keyboard, ReplyKeyboardMarkup)
+        assert isinstance(main_menu_customer, ReplyKeyboardMarkup)
 
-    def test_main_menu_resize_keyboard_enabled(self):
+    def test_main_menu_resize_keyboard_enabled(self, main_menu_customer):
         """Test that resize_keyboard is enabled."""
-        keyboard = get_main_menu_keyboard()
-        assert keyboard.resize_keyboard is True
+        assert main_menu_customer.resize_keyboard is True
 
 
 class TestAdminMenuKeyboard:
     """Tests for the admin menu keyboard."""
 
-    def test_admin_menu_has_emojis(self):
+    def test_admin_menu_has_emojis(self, admin_menu_joined):
         """Test that admin menu buttons have emojis."""
-        keyboard = get_admin_menu_keyboard()
-        buttons = get_button_texts(keyboard)
-        
         # Check that all admin buttons have emojis
-        assert any("💳" in btn for btn in buttons), "Should have payment emoji"
-        assert any("📂" in btn for btn in buttons), "Should have catalog emoji"
-        assert any("⚙️" in btn for btn in buttons), "Should have settings emoji"
-        assert any("👥" in btn for btn in buttons), "Should have admins emoji"
-        assert any("🔙" in btn for btn in buttons), "Should have back emoji"
+        missing = {e for e in REQUIRED_ADMIN_EMOJIS if e not in admin_menu_joined}
+        assert not missing, f"Admin menu is missing emojis: {missing}"
 
-    def test_admin_menu_has_back_button(self):
+    def test_admin_menu_has_back_button(self, admin_menu_buttons):
         """Test that admin menu has back button."""
-        keyboard = get_admin_menu_keyboard()
-        buttons = get_button_texts(keyboard)
-        
-        back_button = [btn for btn in buttons if "بازگشت" in btn]
+        back_button = [btn for btn in admin_menu_buttons if "بازگشت" in btn]
         assert len(back_button) == 1, "Should have exactly one back button"
 
-    def test_admin_menu_returns_reply_keyboard(self):
+    def test_admin_menu_returns_reply_keyboard(self, admin_menu):
         """Test that admin menu returns ReplyKeyboardMarkup."""
-        keyboard = get_admin_menu_keyboard()
-        assert isinstance(keyboard, ReplyKeyboardMarkup)
+        assert isinstance(admin_menu, ReplyKeyboardMarkup)
 
-    def test_admin_menu_button_count(self):
+    def test_admin_menu_button_count(self, admin_menu_buttons):
         """Test that admin menu has correct number of buttons."""
-        keyboard = get_admin_menu_keyboard()
-        buttons = get_button_texts(keyboard)
-        assert len(buttons) == 5, "Admin menu should have 5 buttons"
+        assert len(admin_menu_buttons) == 5, "Admin menu should have 5 buttons"
 
 
 class TestKeyboardConsistency:
     """Tests for keyboard consistency across the application."""
 
-    def test_main_menu_buttons_contain_expected_text(self):
+    def test_main_menu_buttons_contain_expected_text(self, main_menu_admin_joined):
         """Test that main menu contains expected Persian text."""
-        keyboard = get_main_menu_keyboard(is_admin=True)
-        buttons = get_button_texts(keyboard)
-        
-        # Expected Persian texts (without emojis for flexibility)
-        expected_texts = [
-            "ثبت سفارش",
-            "سفارشات من",
-            "پروفایل",
-            "رهگیری سفارش",
-            "پشتیبانی",
-            "راهنما",
-            "پنل مدیریت"
-        ]
-        
-        for text in expected_texts:
-            assert any(text in btn for btn in buttons), \
+        for text in EXPECTED_MAIN_TEXTS:
+            assert text in main_menu_admin_joined, \
                 f"Main menu should contain '{text}'"
 
-    def test_admin_menu_buttons_contain_expected_text(self):
+    def test_admin_menu_buttons_contain_expected_text(self, admin_menu_joined):
         """Test that admin menu contains expected Persian text."""
-        keyboard = get_admin_menu_keyboard()
-        buttons = get_button_texts(keyboard)
-        
-        # Expected Persian texts
-        expected_texts = [
-            "پرداخت",
-            "کاتالوگ",
-            "تنظیمات",
-            "مدیران",
-            "بازگشت"
-        ]
-        
-        for text in expected_texts:
-            assert any(text in btn for btn in buttons), \
+        for text in EXPECTED_ADMIN_TEXTS:
+            assert text in admin_menu_joined, \
                 f"Admin menu should contain '{text}'"
 
     def test_back_keyboard_has_text(self):
@@ -177,16 +178,10 @@ class TestNoLegacyImports:
         assert hasattr(manager, 'get_admin_menu_keyboard')
 
     def test_main_menu_py_deleted(self):
-        """Test that main_menu.py doesn't exist as a module with the function."""
-        try:
-            from keyboards import main_menu
-            # If import works, check if get_main_menu_keyboard exists
-            # It should not, as the file was deleted
-            assert not hasattr(main_menu, 'get_main_menu_keyboard'), \
-                "main_menu.py should be deleted or not have get_main_menu_keyboard"
-        except ImportError:
-            # This is expected - the file should be deleted
-            pass
+        """Test that the legacy keyboards/main_menu.py module is gone."""
+        import keyboards
+        legacy_module = Path(keyboards.__file__).parent / "main_menu.py"
+        assert not legacy_module.exists(), "main_menu.py should be deleted"
 
 
 class TestCategoryListKeyboard:
@@ -203,13 +198,8 @@ class TestCategoryListKeyboard:
         assert isinstance(keyboard, InlineKeyboardMarkup)
         
         # Check that categories are in the keyboard
-        all_buttons = []
-        for row in keyboard.inline_keyboard:
-            for btn in row:
-                all_buttons.append(btn.text)
-        
-        assert any("برچسب" in btn for btn in all_buttons)
-        assert any("کارت ویزیت" in btn for btn in all_buttons)
+        assert any("برچسب" in t for t in iter_inline_texts(keyboard))
+        assert any("کارت ویزیت" in t for t in iter_inline_texts(keyboard))
 
     def test_category_list_empty(self):
         """Test category list with no categories."""
@@ -217,11 +207,6 @@ class TestCategoryListKeyboard:
         assert isinstance(keyboard, InlineKeyboardMarkup)
         
         # Should still have create and back buttons
-        all_buttons = []
-        for row in keyboard.inline_keyboard:
-            for btn in row:
-                all_buttons.append(btn.text)
-        
-        assert any("ایجاد" in btn for btn in all_buttons)
-        assert any("بازگشت" in btn for btn in all_buttons)
+        assert any("ایجاد" in t for t in iter_inline_texts(keyboard))
+        assert any("بازگشت" in t for t in iter_inline_texts(keyboard))
 
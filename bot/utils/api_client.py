@@ -1,88 +1,501 @@
 """API client for communicating with backend."""
 
+import asyncio
+import copy
+import functools
 import httpx
+import importlib.util
 import os
 import logging
-from typing import Optional, Dict, Any, List
+import random
+import time
+from collections import OrderedDict, defaultdict
+from typing import Optional, Dict, Any, List, Tuple, Callable, AsyncIterator, Awaitable
+
+from utils.circuit import CircuitBreaker
+
+try:
+    import orjson
+except ImportError:  # fall back to httpx's stdlib json handling
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets concurrent calls (e.g. admin fan-out) share one connection;
+# it needs the optional h2 package, otherwise httpx stays on HTTP/1.1.
+# httpx only negotiates HTTP/2 through TLS ALPN, so it takes effect when
+# API_BASE_URL is https (e.g. behind a TLS proxy); the plain-http uvicorn
+# backend keeps serving HTTP/1.1, where the keep-alive pool does the work
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Cap on requests in flight at once; extra callers wait here in a bounded,
+# visible queue instead of inside the connection pool
+MAX_IN_FLIGHT = 32
+
+# Connection pool sizing shared by every request to the backend. The
+# bulkhead never has more than MAX_IN_FLIGHT sends open, so the pool is
+# sized to match. Idle sockets are kept for 60s, just under the backend's
+# 75s keep-alive timeout, so the client always drops a connection before
+# the server does
+POOL_LIMITS = httpx.Limits(
+    max_connections=MAX_IN_FLIGHT,
+    max_keepalive_connections=MAX_IN_FLIGHT,
+    keepalive_expiry=60.0,
+)
+
+
+def _accepted_encodings() -> str:
+    """List the compression schemes httpx can decode in this environment.
+
+    br and zstd are only advertised when their optional decoders are
+    installed; otherwise a compressed response would fail to decode.
+    """
+    encodings = ["gzip"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.insert(0, "br")
+    if importlib.util.find_spec("zstandard"):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+# Sent once as client defaults so calls only pass the headers they add
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": _accepted_encodings(),
+    "User-Agent": "sheetaro-bot/1.0",
+}
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+# Transient failures worth retrying. Failed connects never reached the
+# server, so every method retries them. Errors once the request is on the
+# wire (ReadTimeout, a ReadError from a stale keep-alive socket) and retry
+# statuses only re-send idempotent methods, since a POST may already have
+# taken effect server-side.
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.05
+RETRY_BACKOFF_CAP = 1.0
+RETRY_JITTER = 0.5
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Longest Retry-After we are willing to sleep before retrying a request
+RETRY_AFTER_CAP = 5.0
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Overall budget for one request, retries and backoff included
+REQUEST_DEADLINE = 30.0
+
+# After this many consecutive failed attempts the backend is treated as
+# down and requests fail fast until a probe succeeds. Only transport errors
+# and gateway-style statuses count; an application 500 means the backend is
+# up and answering.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = 30.0
+CIRCUIT_STATUSES = frozenset({502, 503, 504})
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Marks a cached "does not exist" result; cached methods ask _request for it
+# via ``missing`` so a 404 can be told apart from a failed request, and
+# async_ttl_cache hands callers None in its place
+_MISSING = object()
+
+# Request latencies are counted in power-of-two nanosecond buckets; the last
+# bucket (2**31ns, about 2.1s) also collects everything slower
+LATENCY_BUCKETS = 32
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_url(base_url: str, path: str) -> httpx.URL:
+    """Build the absolute URL for a backend path, memoized per path.
+    
+    Handing httpx an absolute URL skips its per-request merge with the
+    client's base_url, and repeated paths skip URL parsing entirely.
+    """
+    return httpx.URL(base_url.rstrip("/") + path)
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is available."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _encode_json(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace a ``json=`` request body with an orjson-encoded ``content=``."""
+    if orjson is not None and kwargs.get("json") is not None:
+        kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+        headers = kwargs.get("headers")
+        kwargs["headers"] = {**JSON_CONTENT_HEADERS, **headers} if headers else JSON_CONTENT_HEADERS
+    return kwargs
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Read a Retry-After delay in seconds, capped at RETRY_AFTER_CAP."""
+    value = response.headers.get("Retry-After")
+    if value is None or not value.isdigit():
+        return None
+    return min(RETRY_AFTER_CAP, float(value))
+
+
+async def _iter_pages(
+    fetch: Callable[..., Any],
+    page_size: int,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield items from a paged list endpoint, holding one page at a time.
+    
+    fetch is called with page=N and must return the backend's
+    {"items": [...], "total": N} envelope. Stops early on a failed page.
+    """
+    page = 1
+    while True:
+        result = await fetch(page=page)
+        if not result:
+            return
+        items = result.get("items", [])
+        for item in items:
+            yield item
+        if len(items) < page_size or page * page_size >= result.get("total", 0):
+            return
+        page += 1
+
+
+def async_ttl_cache(ttl: float, maxsize: int = 128, negative_ttl: float = 0) -> Callable:
+    """Cache an async method's non-None results per instance and argument set.
+    
+    Entries live in the instance's ``_caches`` map under the method name, so
+    dropping that entry (see APIClient._cache_invalidate) clears one
+    client's cache without touching other instances. Entries expire after
+    ``ttl`` seconds and the least recently used entry is evicted once
+    ``maxsize`` is reached. A ``_MISSING`` result is cached for
+    ``negative_ttl`` seconds instead (not at all by default) and returned
+    to callers as None. The cache keeps its own deep copy of each result and
+    hands every hit a fresh copy, so callers may mutate what they get.
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: "Optional[OrderedDict[tuple, Tuple[float, Any]]]" = self._caches.get(name)
+            if cache is None:
+                cache = self._caches[name] = OrderedDict()
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else (args,)
+            entry = cache.get(key)
+            now = time.monotonic()
+            if entry is not None:
+                if entry[0] > now:
+                    cache.move_to_end(key)
+                    return None if entry[1] is _MISSING else copy.deepcopy(entry[1])
+                del cache[key]
+            
+            result = await func(self, *args, **kwargs)
+            lifetime = negative_ttl if result is _MISSING else ttl if result is not None else 0
+            if lifetime > 0:
+                cache[key] = (now + lifetime, result if result is _MISSING else copy.deepcopy(result))
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return None if result is _MISSING else result
+        
+        return wrapper
+    return decorator
+
+
+def invalidates(*method_names: str) -> Callable:
+    """Clear the named cached methods after a successful (truthy) write."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            result = await func(self, *args, **kwargs)
+            if result:
+                self._cache_invalidate(*method_names)
+            return result
+        return wrapper
+    return decorator
+
+
+def single_flight(func: Callable) -> Callable:
+    """Share one in-flight call among concurrent callers with the same args.
+    
+    The first caller starts the request as a task stored in the instance's
+    ``_inflight`` map; later callers await that same task instead of sending
+    a duplicate request. The entry is removed as soon as the task finishes.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(self, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller's cancellation does not cancel the shared request
+        return await asyncio.shield(task)
+    return wrapper
+
 
 class APIClient:
-    """Client for communicating with backend API."""
+    """Client for communicating with backend API.
     
-    _instance: Optional["APIClient"] = None
-    _client: Optional[httpx.AsyncClient] = None
+    Use the module-level ``api_client`` instance rather than constructing
+    new clients, so the whole bot shares one connection pool.
+    """
     
-    def __new__(cls) -> "APIClient":
-        """Singleton pattern to reuse the same client instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = (
+        "base_url", "timeout", "_client", "_inflight", "_caches", "_latency", "_breaker", "_bulkhead",
+    )
     
     def __init__(self):
-        if not hasattr(self, '_initialized'):
-            self.base_url = os.getenv("API_BASE_URL", "http://backend:3001")
-            self.timeout = httpx.Timeout(30.0, connect=10.0)
-            self._initialized = True
+        self.base_url = os.getenv("API_BASE_URL", "http://backend:3001")
+        self.timeout = httpx.Timeout(30.0, connect=10.0)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._caches: Dict[str, OrderedDict] = {}
+        self._latency: Dict[str, List[int]] = defaultdict(lambda: [0] * LATENCY_BUCKETS)
+        self._breaker = CircuitBreaker(
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=CIRCUIT_RECOVERY_TIMEOUT,
+        )
+        self._bulkhead = asyncio.Semaphore(MAX_IN_FLIGHT)
+    
+    def _build_client(self) -> httpx.AsyncClient:
+        """Construct the pooled async HTTP client.
+        
+        Retries are handled in _send only, so the transport makes one
+        attempt per call.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_ENABLED,
+            limits=POOL_LIMITS,
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=transport,
+            headers=DEFAULT_HEADERS,
+        )
+    
+    async def startup(self) -> None:
+        """Create the HTTP client up front so the first request finds a ready pool."""
+        await self._get_client()
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the async HTTP client."""
+        """Get or create the async HTTP client (fallback when startup() was not run).
+        
+        The check and the assignment run without an ``await`` in between, so
+        concurrent tasks on the event loop cannot both see a missing client
+        and build two pools; keep _build_client() synchronous to preserve that.
+        """
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-            )
+            self._client = self._build_client()
         return self._client
     
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client; meant for the application's shutdown hook only."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
-            self._client = None
-    
-    # ==================== User APIs ====================
-    
-    async def create_or_update_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Create or update user in backend."""
-        client = await self._get_client()
-        try:
-            response = await client.post("/api/v1/users", json=user_data)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating/updating user: {e}")
-            return None
     
-    async def get_user(self, telegram_id: int) -> Optional[Dict[str, Any]]:
-        """Get user by telegram ID."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/users/{telegram_id}")
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        kwargs: Dict[str, Any],
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, retrying it on transient failures.
+        
+        Failed connects are retried for every method; other transport errors
+        and 429/502/503/504 responses only for idempotent ones. Retries use jittered
+        exponential backoff (50ms doubling, capped at 1s, up to +50%), or
+        the server's Retry-After when it sends one. The whole exchange is
+        bounded by REQUEST_DEADLINE and then fails with TimeoutException. While
+        the circuit breaker is open, attempts fail at once with ConnectError;
+        every attempt reports to the breaker, so retries cannot hide an
+        outage from it.
+        At most MAX_IN_FLIGHT attempts are on the wire at a time; backoff
+        sleeps do not hold a slot.
+        ``idempotent`` overrides the per-method default for endpoints the
+        backend guarantees are safe to repeat. With ``stream`` the body is
+        left unread and the caller must close the returned response.
+        """
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        client = self._client
+        if client is None or client.is_closed:
+            client = await self._get_client()
+        url = _resolve_url(self.base_url, path)
+        kwargs = _encode_json(kwargs)
+        attempts = MAX_RETRIES + 1
+        # Only a deadline that cuts off an attempt on the wire counts against
+        # the backend; time queued on the bulkhead or in backoff does not
+        sending = False
+        try:
+            async with asyncio.timeout(REQUEST_DEADLINE):
+                for attempt in range(attempts):
+                    last = attempt == attempts - 1
+                    retry_after = None
+                    if not self._breaker.allow():
+                        raise httpx.ConnectError("Backend circuit open, skipping request")
+                    try:
+                        async with self._bulkhead:
+                            sending = True
+                            response = await client.send(
+                                client.build_request(method, url, **kwargs), stream=stream
+                            )
+                    except CONNECT_ERRORS:
+                        self._breaker.record_failure()
+                        if last:
+                            raise
+                    except httpx.TransportError:
+                        self._breaker.record_failure()
+                        if last or not idempotent:
+                            raise
+                    else:
+                        if response.status_code in CIRCUIT_STATUSES:
+                            self._breaker.record_failure()
+                        else:
+                            self._breaker.record_success()
+                        if last or not idempotent or response.status_code not in RETRY_STATUSES:
+                            return response
+                        retry_after = _retry_after(response)
+                        await response.aclose()
+                    sending = False
+                    if retry_after is None:
+                        delay = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt)
+                        retry_after = delay * (1 + random.random() * RETRY_JITTER)
+                    await asyncio.sleep(retry_after)
+        except TimeoutError:
+            if sending:
+                self._breaker.record_failure()
+            raise httpx.TimeoutException(f"No response within {REQUEST_DEADLINE}s") from None
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        error: str,
+        ok404: bool = False,
+        missing: Any = None,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Optional[Any]:
+        """Send a request and return the decoded JSON body, or None on failure.
+        
+        ``error`` completes the log line ("Error <error>: ..."). With
+        ``ok404`` a 404 response is a normal "not found" result: it is not
+        logged and ``missing`` (None by default) is returned. Callers that
+        must tell a miss from a failure, such as methods under async_ttl_cache,
+        pass ``missing=_MISSING``.
+        ``idempotent`` is passed on to _send().
+        """
+        started = time.perf_counter_ns()
+        try:
+            response = await self._send(method, path, kwargs, idempotent)
             response.raise_for_status()
-            return response.json()
+            return _json(response)
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            logger.error(f"Error getting user: {e}")
+            if ok404 and e.response.status_code == 404:
+                return missing
+            logger.error(f"Error {error}: {e}")
             return None
         except httpx.HTTPError as e:
-            logger.error(f"Error getting user: {e}")
+            logger.error(f"Error {error}: {e}")
             return None
+        finally:
+            self._record_latency(error, started)
     
+    async def _request_ok(
+        self,
+        method: str,
+        path: str,
+        *,
+        expected: int,
+        error: str,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> bool:
+        """Send a request and report whether it returned the expected status.
+        
+        Only the status line matters here, so the body is never read.
+        """
+        started = time.perf_counter_ns()
+        try:
+            response = await self._send(method, path, kwargs, idempotent, stream=True)
+            await response.aclose()
+            return response.status_code == expected
+        except httpx.HTTPError as e:
+            logger.error(f"Error {error}: {e}")
+            return False
+        finally:
+            self._record_latency(error, started)
+    
+    def _record_latency(self, endpoint: str, started: int) -> None:
+        """Count one request's duration in the endpoint's latency histogram."""
+        bucket = min(LATENCY_BUCKETS - 1, (time.perf_counter_ns() - started).bit_length())
+        self._latency[endpoint][bucket] += 1
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize request latency per endpoint since startup.
+        
+        Endpoints are keyed by their error label (e.g. "getting user").
+        Percentiles are the upper bound of the bucket they fall in, in ms.
+        """
+        summary = {}
+        for endpoint, buckets in self._latency.items():
+            count = sum(buckets)
+            percentiles = {}
+            seen = 0
+            for bucket, hits in enumerate(buckets):
+                seen += hits
+                for name, fraction in (("p50_ms", 0.5), ("p99_ms", 0.99)):
+                    if name not in percentiles and seen >= count * fraction:
+                        percentiles[name] = 2 ** bucket / 1e6
+            summary[endpoint] = {"count": count, **percentiles, "buckets": list(buckets)}
+        return summary
+    
+    def _cache_invalidate(self, *method_names: str) -> None:
+        """Drop this client's cached results of the given cached methods."""
+        for name in method_names:
+            self._caches.pop(name, None)
+    
+    # ==================== User APIs ====================
+    
+    @invalidates("get_user")
+    async def create_or_update_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create or update user in backend."""
+        return await self._request(
+            "POST",
+            "/api/v1/users",
+            json=user_data,
+            error="creating/updating user",
+        )
+    
+    @async_ttl_cache(ttl=5, maxsize=1024, negative_ttl=1)
+    @single_flight
+    async def get_user(self, telegram_id: int) -> Optional[Dict[str, Any]]:
+        """Get user by telegram ID."""
+        return await self._request(
+            "GET",
+            f"/api/v1/users/{telegram_id}",
+            error="getting user",
+            ok404=True,
+            missing=_MISSING,
+        )
+    
+    @invalidates("get_user")
     async def update_user(self, telegram_id: int, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update user by telegram ID."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(f"/api/v1/users/{telegram_id}", json=user_data)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating user: {e}")
-            return None
+        return await self._request(
+            "PATCH",
+            f"/api/v1/users/{telegram_id}",
+            json=user_data,
+            error="updating user",
+        )
     
     # ==================== Product APIs ====================
     
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_products(
         self,
         product_type: Optional[str] = None,
@@ -90,45 +503,35 @@ class APIClient:
         page_size: int = 20,
     ) -> Optional[Dict[str, Any]]:
         """Get list of products."""
-        client = await self._get_client()
-        try:
-            params = {"page": page, "page_size": page_size}
-            if product_type:
-                params["type"] = product_type
-            response = await client.get("/api/v1/products", params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting products: {e}")
-            return None
-    
+        params = tuple(
+            (k, v)
+            for k, v in (("page", page), ("page_size", page_size), ("type", product_type))
+            if v is not None
+        )
+        return await self._request(
+            "GET",
+            "/api/v1/products",
+            params=params,
+            error="getting products",
+        )
+    
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_product(self, product_id: str) -> Optional[Dict[str, Any]]:
         """Get product by ID."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/products/{product_id}")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting product: {e}")
-            return None
+        return await self._request("GET", f"/api/v1/products/{product_id}", error="getting product")
     
     # ==================== Order APIs ====================
     
     async def create_order(self, user_id: str, order_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new order."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                "/api/v1/orders",
-                json=order_data,
-                params={"user_id": user_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating order: {e}")
-            return None
+        return await self._request(
+            "POST",
+            "/api/v1/orders",
+            json=order_data,
+            params={"user_id": user_id},
+            error="creating order",
+        )
     
     async def get_user_orders(
         self,
@@ -138,45 +541,51 @@ class APIClient:
         page_size: int = 20,
     ) -> Optional[Dict[str, Any]]:
         """Get orders for a user."""
-        client = await self._get_client()
-        try:
-            params = {"user_id": user_id, "page": page, "page_size": page_size}
-            if status:
-                params["status"] = status
-            response = await client.get("/api/v1/orders", params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting orders: {e}")
-            return None
+        params = tuple(
+            (k, v)
+            for k, v in (
+                ("user_id", user_id),
+                ("page", page),
+                ("page_size", page_size),
+                ("status", status),
+            )
+            if v is not None
+        )
+        return await self._request("GET", "/api/v1/orders", params=params, error="getting orders")
+    
+    async def iter_user_orders(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        page_size: int = 20,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a user's orders one at a time, fetching one page at a time.
+        
+        Only a single page is held in memory, so long order histories can be
+        walked without loading them all at once. Stops early on a failed page.
+        """
+        fetch = functools.partial(self.get_user_orders, user_id, status=status, page_size=page_size)
+        async for order in _iter_pages(fetch, page_size):
+            yield order
     
     async def get_order(self, order_id: str, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get order by ID."""
-        client = await self._get_client()
-        try:
-            params = {}
-            if user_id:
-                params["user_id"] = user_id
-            response = await client.get(f"/api/v1/orders/{order_id}", params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting order: {e}")
-            return None
+        params = (("user_id", user_id),) if user_id is not None else None
+        return await self._request(
+            "GET",
+            f"/api/v1/orders/{order_id}",
+            params=params,
+            error="getting order",
+        )
     
     async def cancel_order(self, order_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Cancel an order."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/orders/{order_id}/cancel",
-                params={"user_id": user_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error cancelling order: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/orders/{order_id}/cancel",
+            params={"user_id": user_id},
+            error="cancelling order",
+        )
     
     # ==================== Payment APIs ====================
     
@@ -188,49 +597,37 @@ class APIClient:
         callback_url: str,
     ) -> Optional[Dict[str, Any]]:
         """Initiate a payment."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                "/api/v1/payments/initiate",
-                json={
-                    "order_id": order_id,
-                    "type": payment_type,
-                    "callback_url": callback_url,
-                },
-                params={"user_id": user_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error initiating payment: {e}")
-            return None
+        return await self._request(
+            "POST",
+            "/api/v1/payments/initiate",
+            json={
+                "order_id": order_id,
+                "type": payment_type,
+                "callback_url": callback_url,
+            },
+            params={"user_id": user_id},
+            error="initiating payment",
+        )
     
     async def get_payment_summary(self, order_id: str) -> Optional[Dict[str, Any]]:
         """Get payment summary for an order."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/payments/order/{order_id}/summary")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting payment summary: {e}")
-            return None
-    
+        return await self._request(
+            "GET",
+            f"/api/v1/payments/order/{order_id}/summary",
+            error="getting payment summary",
+        )
+    
+    @async_ttl_cache(ttl=300, maxsize=1, negative_ttl=60)
+    @single_flight
     async def get_payment_card(self) -> Optional[Dict[str, Any]]:
         """Get payment card info for card-to-card payments."""
-        client = await self._get_client()
-        try:
-            response = await client.get("/api/v1/settings/payment-card")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            logger.error(f"Error getting payment card: {e}")
-            return None
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting payment card: {e}")
-            return None
+        return await self._request(
+            "GET",
+            "/api/v1/settings/payment-card",
+            error="getting payment card",
+            ok404=True,
+            missing=_MISSING,
+        )
     
     async def upload_receipt(
         self,
@@ -239,18 +636,13 @@ class APIClient:
         receipt_image_url: str,
     ) -> Optional[Dict[str, Any]]:
         """Upload receipt for card-to-card payment."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/payments/{payment_id}/upload-receipt",
-                json={"receipt_image_url": receipt_image_url},
-                params={"user_id": user_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error uploading receipt: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/payments/{payment_id}/upload-receipt",
+            json={"receipt_image_url": receipt_image_url},
+            params={"user_id": user_id},
+            error="uploading receipt",
+        )
     
     async def get_pending_approval_payments(
         self,
@@ -259,17 +651,26 @@ class APIClient:
         page_size: int = 20,
     ) -> Optional[Dict[str, Any]]:
         """Get payments pending approval (admin only)."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                "/api/v1/payments/pending-approval",
-                params={"admin_id": admin_id, "page": page, "page_size": page_size}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting pending payments: {e}")
-            return None
+        return await self._request(
+            "GET",
+            "/api/v1/payments/pending-approval",
+            params=(("admin_id", admin_id), ("page", page), ("page_size", page_size)),
+            error="getting pending payments",
+        )
+    
+    async def iter_pending_approval_payments(
+        self,
+        admin_id: str,
+        page_size: int = 100,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield payments pending approval one at a time (admin only).
+        
+        Pages are fetched lazily, so memory stays bounded by page_size no
+        matter how large the approval queue grows.
+        """
+        fetch = functools.partial(self.get_pending_approval_payments, admin_id, page_size=page_size)
+        async for payment in _iter_pages(fetch, page_size):
+            yield payment
     
     async def approve_payment(
         self,
@@ -277,17 +678,12 @@ class APIClient:
         admin_id: str,
     ) -> Optional[Dict[str, Any]]:
         """Approve a payment (admin only)."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/payments/{payment_id}/approve",
-                json={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error approving payment: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/payments/{payment_id}/approve",
+            json={"admin_id": admin_id},
+            error="approving payment",
+        )
     
     async def reject_payment(
         self,
@@ -296,18 +692,14 @@ class APIClient:
         reason: str,
     ) -> Optional[Dict[str, Any]]:
         """Reject a payment (admin only)."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/payments/{payment_id}/reject",
-                json={"admin_id": admin_id, "reason": reason}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error rejecting payment: {e}")
-            return None
-    
+        return await self._request(
+            "POST",
+            f"/api/v1/payments/{payment_id}/reject",
+            json={"admin_id": admin_id, "reason": reason},
+            error="rejecting payment",
+        )
+    
+    @invalidates("get_payment_card")
     async def update_payment_card(
         self,
         admin_id: str,
@@ -315,696 +707,570 @@ class APIClient:
         card_holder: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """Update payment card info (admin only). Partial update supported."""
-        client = await self._get_client()
-        try:
-            # Build payload with only non-None values
-            payload = {}
-            if card_number is not None:
-                payload["card_number"] = card_number
-            if card_holder is not None:
-                payload["card_holder"] = card_holder
-            
-            response = await client.patch(
-                "/api/v1/settings/payment-card",
-                json=payload,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating payment card: {e}")
-            return None
+        # Build payload with only non-None values
+        payload = {
+            k: v
+            for k, v in (("card_number", card_number), ("card_holder", card_holder))
+            if v is not None
+        }
+        
+        return await self._request(
+            "PATCH",
+            "/api/v1/settings/payment-card",
+            json=payload,
+            params={"admin_id": admin_id},
+            error="updating payment card",
+        )
     
     async def get_payment(self, payment_id: str) -> Optional[Dict[str, Any]]:
         """Get payment by ID."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/payments/{payment_id}")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting payment: {e}")
-            return None
+        return await self._request("GET", f"/api/v1/payments/{payment_id}", error="getting payment")
     
     # ==================== Admin Management APIs ====================
     
     async def get_all_admins(self, admin_id: str) -> Optional[Dict[str, Any]]:
         """Get all admin users."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                "/api/v1/users/admins/list",
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting admins: {e}")
-            return None
-    
+        return await self._request(
+            "GET",
+            "/api/v1/users/admins/list",
+            params={"admin_id": admin_id},
+            error="getting admins",
+        )
+    
+    @async_ttl_cache(ttl=300, maxsize=1)
+    @single_flight
     async def get_admin_telegram_ids(self) -> Optional[List[int]]:
         """Get telegram IDs of all active admins."""
-        client = await self._get_client()
-        try:
-            response = await client.get("/api/v1/users/admins/telegram-ids")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting admin telegram IDs: {e}")
-            return None
+        return await self._request(
+            "GET",
+            "/api/v1/users/admins/telegram-ids",
+            error="getting admin telegram IDs",
+        )
     
-    async def promote_to_admin(
+    async def map_admins(
+        self,
+        fn: Callable[[int], Awaitable[Any]],
+        concurrency: int = 32,
+    ) -> List[Any]:
+        """Call fn for every admin telegram ID concurrently.
+        
+        At most `concurrency` calls run at once; results are returned in
+        admin order. fn should handle its own errors, since one failure
+        cancels the remaining calls.
+        """
+        ids = await self.get_admin_telegram_ids() or []
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(telegram_id: int) -> Any:
+            async with semaphore:
+                return await fn(telegram_id)
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run(telegram_id)) for telegram_id in ids]
+        return [task.result() for task in tasks]
+    
+    @invalidates("get_admin_telegram_ids", "get_user")
+    async def promote_to_admin_by_telegram_id(
         self,
         target_telegram_id: int,
         admin_id: str,
     ) -> Optional[Dict[str, Any]]:
-        """Promote a user to admin."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                "/api/v1/users/admins/promote",
-                json={"target_telegram_id": target_telegram_id},
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error promoting user: {e}")
-            return None
-    
+        """Promote a user to admin by telegram ID (admin panel)."""
+        return await self._request(
+            "POST",
+            "/api/v1/users/admins/promote",
+            json={"target_telegram_id": target_telegram_id},
+            params={"admin_id": admin_id},
+            error="promoting user",
+        )
+    
+    @invalidates("get_admin_telegram_ids", "get_user")
     async def demote_from_admin(
         self,
         target_telegram_id: int,
         admin_id: str,
     ) -> Optional[Dict[str, Any]]:
         """Demote an admin to customer."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                "/api/v1/users/admins/demote",
-                json={"target_telegram_id": target_telegram_id},
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error demoting admin: {e}")
-            return None
+        return await self._request(
+            "POST",
+            "/api/v1/users/admins/demote",
+            json={"target_telegram_id": target_telegram_id},
+            params={"admin_id": admin_id},
+            error="demoting admin",
+        )
+    
+    @invalidates("get_admin_telegram_ids", "get_user")
+    async def promote_to_admin(
+        self,
+        user_id: str,
+        admin_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Promote a user to admin by backend user ID (self-promotion via secret code).
+        
+        For promoting someone else from the admin panel use
+        promote_to_admin_by_telegram_id().
+        """
+        # If admin_id is not provided, use user_id (self-promotion via secret code)
+        return await self._request(
+            "POST",
+            f"/api/v1/users/{user_id}/promote",
+            params=(("admin_id", admin_id or user_id),),
+            error="promoting user",
+        )
     
     # ==================== Subscription APIs ====================
     
+    @single_flight
     async def get_subscription_status(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get subscription status for a user."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                "/api/v1/subscriptions/me",
-                params={"user_id": user_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting subscription status: {e}")
+        return await self._request(
+            "GET",
+            "/api/v1/subscriptions/me",
+            params={"user_id": user_id},
+            error="getting subscription status",
+        )
+    
+    async def get_user_context(
+        self,
+        telegram_id: int,
+        include: Tuple[str, ...] = ("user", "subscription", "recent_orders"),
+        orders_page_size: int = 5,
+    ) -> Optional[Dict[str, Any]]:
+        """Get user, subscription status and recent orders in one round trip.
+        
+        A 404 falls back to get_user followed by the other lookups run
+        concurrently, which covers both unknown users and older backends
+        without the context endpoint.
+        """
+        context = await self._request(
+            "GET",
+            f"/api/v1/users/{telegram_id}/context",
+            params=[("include", part) for part in include] + [("orders_page_size", orders_page_size)],
+            error="getting user context",
+            ok404=True,
+            missing=_MISSING,
+        )
+        if context is not _MISSING:
+            return context
+        
+        user = await self.get_user(telegram_id)
+        if not user:
             return None
+        
+        context = {"user": user, "subscription": None, "recent_orders": None}
+        calls = {}
+        if "subscription" in include:
+            calls["subscription"] = self.get_subscription_status(user["id"])
+        if "recent_orders" in include:
+            calls["recent_orders"] = self.get_user_orders(user["id"], page_size=orders_page_size)
+        context.update(zip(calls, await asyncio.gather(*calls.values())))
+        return context
     
     async def get_user_by_telegram_id(self, telegram_id: int) -> Optional[Dict[str, Any]]:
         """Get user by telegram ID - wrapper around get_user."""
         return await self.get_user(telegram_id)
     
-    async def promote_to_admin(self, user_id: str, admin_id: str = None) -> Optional[Dict[str, Any]]:
-        """Promote a user to admin (self-promotion for secret code)."""
-        client = await self._get_client()
-        try:
-            # If admin_id is not provided, use user_id (self-promotion via secret code)
-            params = {"admin_id": admin_id if admin_id else user_id}
-            response = await client.post(
-                f"/api/v1/users/{user_id}/promote",
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error promoting user: {e}")
-            return None
-    
     # ==================== Category APIs ====================
     
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_categories(self, active_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get all categories."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                "/api/v1/categories",
-                params={"active_only": active_only}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting categories: {e}")
-            return None
-    
+        return await self._request(
+            "GET",
+            "/api/v1/categories",
+            params={"active_only": active_only},
+            error="getting categories",
+        )
+    
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_category(self, category_id: str) -> Optional[Dict[str, Any]]:
         """Get category by ID."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/categories/{category_id}")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting category: {e}")
-            return None
-    
+        return await self._request(
+            "GET",
+            f"/api/v1/categories/{category_id}",
+            error="getting category",
+        )
+    
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_category_details(self, category_id: str) -> Optional[Dict[str, Any]]:
         """Get category with all related data."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/categories/{category_id}/details")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting category details: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/categories/{category_id}/details",
+            error="getting category details",
+        )
     
+    @invalidates("get_categories", "get_category", "get_category_details")
     async def create_category(self, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new category."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                "/api/v1/categories",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating category: {e}")
-            return None
-    
+        return await self._request(
+            "POST",
+            "/api/v1/categories",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating category",
+        )
+    
+    @invalidates("get_categories", "get_category", "get_category_details")
     async def update_category(self, category_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a category."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                f"/api/v1/categories/{category_id}",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating category: {e}")
-            return None
-    
+        return await self._request(
+            "PATCH",
+            f"/api/v1/categories/{category_id}",
+            json=data,
+            params={"admin_id": admin_id},
+            error="updating category",
+        )
+    
+    @invalidates("get_categories", "get_category", "get_category_details")
     async def delete_category(self, category_id: str, admin_id: str) -> bool:
         """Delete a category."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/categories/{category_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting category: {e}")
-            return False
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/categories/{category_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting category",
+        )
     
     # ==================== Attribute APIs ====================
     
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_attributes(self, category_id: str, active_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get all attributes for a category."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                f"/api/v1/categories/{category_id}/attributes",
-                params={"active_only": active_only}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting attributes: {e}")
-            return None
-    
+        return await self._request(
+            "GET",
+            f"/api/v1/categories/{category_id}/attributes",
+            params={"active_only": active_only},
+            error="getting attributes",
+        )
+    
+    @invalidates("get_attributes", "get_category_details")
     async def create_attribute(self, category_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new attribute."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/categories/{category_id}/attributes",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating attribute: {e}")
-            return None
-    
+        return await self._request(
+            "POST",
+            f"/api/v1/categories/{category_id}/attributes",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating attribute",
+        )
+    
+    @invalidates("get_attributes", "get_category_details")
     async def update_attribute(self, attribute_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an attribute."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                f"/api/v1/attributes/{attribute_id}",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating attribute: {e}")
-            return None
-    
+        return await self._request(
+            "PATCH",
+            f"/api/v1/attributes/{attribute_id}",
+            json=data,
+            params={"admin_id": admin_id},
+            error="updating attribute",
+        )
+    
+    @invalidates("get_attributes", "get_category_details")
     async def delete_attribute(self, attribute_id: str, admin_id: str) -> bool:
         """Delete an attribute."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/attributes/{attribute_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting attribute: {e}")
-            return False
-    
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/attributes/{attribute_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting attribute",
+        )
+    
+    @invalidates("get_attributes", "get_category_details")
     async def create_attribute_option(self, attribute_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new attribute option."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/attributes/{attribute_id}/options",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating attribute option: {e}")
-            return None
-    
+        return await self._request(
+            "POST",
+            f"/api/v1/attributes/{attribute_id}/options",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating attribute option",
+        )
+    
+    @invalidates("get_attributes", "get_category_details")
     async def delete_attribute_option(self, option_id: str, admin_id: str) -> bool:
         """Delete an attribute option."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/options/{option_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting attribute option: {e}")
-            return False
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/options/{option_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting attribute option",
+        )
     
     # ==================== Design Plan APIs ====================
     
+    @async_ttl_cache(ttl=60, maxsize=256)
+    @single_flight
     async def get_design_plans(self, category_id: str, active_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get all design plans for a category."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                f"/api/v1/categories/{category_id}/plans",
-                params={"active_only": active_only}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting design plans: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/categories/{category_id}/plans",
+            params={"active_only": active_only},
+            error="getting design plans",
+        )
     
     async def get_design_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
         """Get design plan by ID."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/plans/{plan_id}")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting design plan: {e}")
-            return None
+        return await self._request("GET", f"/api/v1/plans/{plan_id}", error="getting design plan")
     
     async def get_design_plan_details(self, plan_id: str) -> Optional[Dict[str, Any]]:
         """Get design plan with questions and templates."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/plans/{plan_id}/details")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting design plan details: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/plans/{plan_id}/details",
+            error="getting design plan details",
+        )
     
+    @invalidates("get_design_plans", "get_category_details")
     async def create_design_plan(self, category_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new design plan."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/categories/{category_id}/plans",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating design plan: {e}")
-            return None
-    
+        return await self._request(
+            "POST",
+            f"/api/v1/categories/{category_id}/plans",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating design plan",
+        )
+    
+    @invalidates("get_design_plans", "get_category_details")
     async def update_design_plan(self, plan_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a design plan."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                f"/api/v1/plans/{plan_id}",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating design plan: {e}")
-            return None
-    
+        return await self._request(
+            "PATCH",
+            f"/api/v1/plans/{plan_id}",
+            json=data,
+            params={"admin_id": admin_id},
+            error="updating design plan",
+        )
+    
+    @invalidates("get_design_plans", "get_category_details")
     async def delete_design_plan(self, plan_id: str, admin_id: str) -> bool:
         """Delete a design plan."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/plans/{plan_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting design plan: {e}")
-            return False
-    
-    # ==================== Question APIs ====================
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/plans/{plan_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting design plan",
+        )
     
     # ==================== Section APIs ====================
     
     async def get_sections(self, plan_id: str, active_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get all sections for a plan with their questions."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                f"/api/v1/plans/{plan_id}/sections",
-                params={"active_only": active_only}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting sections: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/plans/{plan_id}/sections",
+            params={"active_only": active_only},
+            error="getting sections",
+        )
     
     async def get_section(self, section_id: str) -> Optional[Dict[str, Any]]:
         """Get a section by ID."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/sections/{section_id}")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting section: {e}")
-            return None
+        return await self._request("GET", f"/api/v1/sections/{section_id}", error="getting section")
     
     async def create_section(self, plan_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new section."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/plans/{plan_id}/sections",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating section: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/plans/{plan_id}/sections",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating section",
+        )
     
     async def update_section(self, section_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a section."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                f"/api/v1/sections/{section_id}",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating section: {e}")
-            return None
+        return await self._request(
+            "PATCH",
+            f"/api/v1/sections/{section_id}",
+            json=data,
+            params={"admin_id": admin_id},
+            error="updating section",
+        )
     
     async def delete_section(self, section_id: str, admin_id: str) -> bool:
         """Delete a section."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/sections/{section_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting section: {e}")
-            return False
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/sections/{section_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting section",
+        )
     
     async def reorder_sections(self, items: List[Dict[str, Any]], admin_id: str) -> bool:
         """Reorder sections."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                "/api/v1/sections/reorder",
-                json={"items": items},
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 200
-        except httpx.HTTPError as e:
-            logger.error(f"Error reordering sections: {e}")
-            return False
+        return await self._request_ok(
+            "PATCH",
+            "/api/v1/sections/reorder",
+            json={"items": items},
+            params={"admin_id": admin_id},
+            expected=200,
+            error="reordering sections",
+        )
     
     # ==================== Question APIs ====================
     
     async def get_questions(self, plan_id: str, active_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get all questions for a plan."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                f"/api/v1/plans/{plan_id}/questions",
-                params={"active_only": active_only}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting questions: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/plans/{plan_id}/questions",
+            params={"active_only": active_only},
+            error="getting questions",
+        )
     
     async def create_question(self, plan_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new question."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/plans/{plan_id}/questions",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating question: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/plans/{plan_id}/questions",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating question",
+        )
     
     async def update_question(self, question_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a question."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                f"/api/v1/questions/{question_id}",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating question: {e}")
-            return None
+        return await self._request(
+            "PATCH",
+            f"/api/v1/questions/{question_id}",
+            json=data,
+            params={"admin_id": admin_id},
+            error="updating question",
+        )
     
     async def delete_question(self, question_id: str, admin_id: str) -> bool:
         """Delete a question."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/questions/{question_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting question: {e}")
-            return False
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/questions/{question_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting question",
+        )
     
     async def create_question_option(self, question_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new question option."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/questions/{question_id}/options",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating question option: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/questions/{question_id}/options",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating question option",
+        )
     
     # ==================== Template APIs ====================
     
     async def get_templates(self, plan_id: str, active_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get all templates for a plan."""
-        client = await self._get_client()
-        try:
-            response = await client.get(
-                f"/api/v1/plans/{plan_id}/templates",
-                params={"active_only": active_only}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting templates: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/plans/{plan_id}/templates",
+            params={"active_only": active_only},
+            error="getting templates",
+        )
     
     async def create_template(self, plan_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new template."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/plans/{plan_id}/templates",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating template: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/plans/{plan_id}/templates",
+            json=data,
+            params={"admin_id": admin_id},
+            error="creating template",
+        )
     
     async def update_template(self, template_id: str, admin_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a template."""
-        client = await self._get_client()
-        try:
-            response = await client.patch(
-                f"/api/v1/templates/{template_id}",
-                json=data,
-                params={"admin_id": admin_id}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error updating template: {e}")
-            return None
+        return await self._request(
+            "PATCH",
+            f"/api/v1/templates/{template_id}",
+            json=data,
+            params={"admin_id": admin_id},
+            error="updating template",
+        )
     
     async def delete_template(self, template_id: str, admin_id: str) -> bool:
         """Delete a template."""
-        client = await self._get_client()
-        try:
-            response = await client.delete(
-                f"/api/v1/templates/{template_id}",
-                params={"admin_id": admin_id}
-            )
-            return response.status_code == 204
-        except httpx.HTTPError as e:
-            logger.error(f"Error deleting template: {e}")
-            return False
+        return await self._request_ok(
+            "DELETE",
+            f"/api/v1/templates/{template_id}",
+            params={"admin_id": admin_id},
+            expected=204,
+            error="deleting template",
+        )
     
     async def apply_logo_to_template(self, template_id: str, logo_url: str) -> Optional[Dict[str, Any]]:
         """Apply a logo to a template and get preview/final URLs."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/templates/{template_id}/apply-logo",
-                json={"logo_file_url": logo_url}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error applying logo to template: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/templates/{template_id}/apply-logo",
+            json={"logo_file_url": logo_url},
+            error="applying logo to template",
+        )
     
     # ==================== Questionnaire Answer APIs ====================
     
     async def validate_answer(self, question_id: str, answer_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Validate a single answer for a question."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/questions/{question_id}/validate",
-                json=answer_data
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error validating answer: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/questions/{question_id}/validate",
+            json=answer_data,
+            error="validating answer",
+        )
     
     async def submit_answers(self, order_id: str, answers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Submit all questionnaire answers for an order."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/orders/{order_id}/answers",
-                json={"answers": answers}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error submitting answers: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/orders/{order_id}/answers",
+            json={"answers": answers},
+            error="submitting answers",
+        )
     
     async def get_order_answers(self, order_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get all answers for an order."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/orders/{order_id}/answers")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting order answers: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/orders/{order_id}/answers",
+            error="getting order answers",
+        )
     
     async def get_answers_summary(self, order_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get a formatted summary of answers for an order."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/orders/{order_id}/answers/summary")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting answers summary: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/orders/{order_id}/answers/summary",
+            error="getting answers summary",
+        )
     
     async def create_order_design(self, order_id: str, template_id: str, logo_url: str) -> Optional[Dict[str, Any]]:
         """Create a processed design for an order."""
-        client = await self._get_client()
-        try:
-            response = await client.post(
-                f"/api/v1/orders/{order_id}/design",
-                json={"template_id": template_id, "logo_url": logo_url}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error creating order design: {e}")
-            return None
+        return await self._request(
+            "POST",
+            f"/api/v1/orders/{order_id}/design",
+            json={"template_id": template_id, "logo_url": logo_url},
+            error="creating order design",
+        )
     
     async def get_order_designs(self, order_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get all processed designs for an order."""
-        client = await self._get_client()
-        try:
-            response = await client.get(f"/api/v1/orders/{order_id}/design")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Error getting order designs: {e}")
-            return None
+        return await self._request(
+            "GET",
+            f"/api/v1/orders/{order_id}/design",
+            error="getting order designs",
+        )
 
 
 # Singleton instance for easy import
@@ -25,94 +25,120 @@ from typing import Optional, List
 from telegram.ext import ContextTypes
 
 
+# Shared path prefixes, so related paths are built from one definition
+_ROOT = ("🔧 پنل مدیریت",)
+_PAYMENTS = _ROOT + ("💳 پرداخت‌ها",)
+_ADMINS = _ROOT + ("👥 مدیران",)
+_SETTINGS = _ROOT + ("⚙️ تنظیمات کارت",)
+_CATALOG = _ROOT + ("📂 مدیریت کاتالوگ",)
+_CATEGORIES = _CATALOG + ("دسته‌بندی‌ها",)
+
+
 class BreadcrumbPath(Enum):
     """Predefined breadcrumb paths for admin menus."""
     
     # Root paths
-    ADMIN_MENU = ("🔧 پنل مدیریت",)
+    ADMIN_MENU = _ROOT
     
     # Payment paths
-    PAYMENTS_PENDING = ("🔧 پنل مدیریت", "💳 پرداخت‌ها")
-    PAYMENT_REVIEW = ("🔧 پنل مدیریت", "💳 پرداخت‌ها", "بررسی")
+    PAYMENTS_PENDING = _PAYMENTS
+    PAYMENT_REVIEW = _PAYMENTS + ("بررسی",)
     
     # Admin management paths
-    ADMIN_MANAGEMENT = ("🔧 پنل مدیریت", "👥 مدیران")
-    ADMIN_INFO = ("🔧 پنل مدیریت", "👥 مدیران")  # + admin name
-    ADMIN_ADD = ("🔧 پنل مدیریت", "👥 مدیران", "➕ افزودن")
+    ADMIN_MANAGEMENT = _ADMINS
+    ADMIN_INFO = _ADMINS  # + admin name
+    ADMIN_ADD = _ADMINS + ("➕ افزودن",)
     
     # Settings paths
-    SETTINGS = ("🔧 پنل مدیریت", "⚙️ تنظیمات کارت")
-    SETTINGS_CARD_NUMBER = ("🔧 پنل مدیریت", "⚙️ تنظیمات کارت", "شماره کارت")
-    SETTINGS_CARD_HOLDER = ("🔧 پنل مدیریت", "⚙️ تنظیمات کارت", "نام صاحب")
+    SETTINGS = _SETTINGS
+    SETTINGS_CARD_NUMBER = _SETTINGS + ("شماره کارت",)
+    SETTINGS_CARD_HOLDER = _SETTINGS + ("نام صاحب",)
     
     # Catalog paths
-    CATALOG_MENU = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ")
-    CATALOG_CATEGORIES = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")
-    CATALOG_CATEGORY_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها", "➕ دسته جدید")
+    CATALOG_MENU = _CATALOG
+    CATALOG_CATEGORIES = _CATEGORIES
+    CATALOG_CATEGORY_CREATE = _CATEGORIES + ("➕ دسته جدید",)
     
     # Category actions
-    CATEGORY_VIEW = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category name
-    CATEGORY_ATTRIBUTES = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category name + "ویژگی‌ها"
-    CATEGORY_PLANS = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category name + "پلن‌ها"
+    CATEGORY_VIEW = _CATEGORIES  # + category name
+    CATEGORY_ATTRIBUTES = _CATEGORIES  # + category name + "ویژگی‌ها"
+    CATEGORY_PLANS = _CATEGORIES  # + category name + "پلن‌ها"
     
     # Attribute paths (dynamic - add category and attribute names)
-    ATTRIBUTE_VIEW = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "ویژگی‌ها" + attr
-    ATTRIBUTE_OPTIONS = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "ویژگی‌ها" + attr + "گزینه‌ها"
-    ATTRIBUTE_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "ویژگی‌ها" + "➕ ویژگی جدید"
+    ATTRIBUTE_VIEW = _CATEGORIES  # + category + "ویژگی‌ها" + attr
+    ATTRIBUTE_OPTIONS = _CATEGORIES  # + category + "ویژگی‌ها" + attr + "گزینه‌ها"
+    ATTRIBUTE_CREATE = _CATEGORIES  # + category + "ویژگی‌ها" + "➕ ویژگی جدید"
     
     # Option paths (dynamic)
-    OPTION_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + ... + "➕ گزینه جدید"
+    OPTION_CREATE = _CATEGORIES  # + category + ... + "➕ گزینه جدید"
     
     # Plan paths (dynamic - add category and plan names)
-    PLAN_VIEW = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "پلن‌ها" + plan
-    PLAN_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "پلن‌ها" + "➕ پلن جدید"
-    PLAN_QUESTIONNAIRE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "پلن‌ها" + plan + "پرسشنامه"
-    PLAN_TEMPLATES = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + category + "پلن‌ها" + plan + "قالب‌ها"
+    PLAN_VIEW = _CATEGORIES  # + category + "پلن‌ها" + plan
+    PLAN_CREATE = _CATEGORIES  # + category + "پلن‌ها" + "➕ پلن جدید"
+    PLAN_QUESTIONNAIRE = _CATEGORIES  # + category + "پلن‌ها" + plan + "پرسشنامه"
+    PLAN_TEMPLATES = _CATEGORIES  # + category + "پلن‌ها" + plan + "قالب‌ها"
     
     # Section paths (dynamic)
-    SECTION_LIST = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "پرسشنامه" + "بخش‌ها"
-    SECTION_VIEW = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "بخش‌ها" + section
-    SECTION_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "➕ بخش جدید"
+    SECTION_LIST = _CATEGORIES  # + ... + "پرسشنامه" + "بخش‌ها"
+    SECTION_VIEW = _CATEGORIES  # + ... + "بخش‌ها" + section
+    SECTION_CREATE = _CATEGORIES  # + ... + "➕ بخش جدید"
     
     # Question paths (dynamic)
-    QUESTION_LIST = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "سوالات"
-    QUESTION_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "➕ سوال جدید"
+    QUESTION_LIST = _CATEGORIES  # + ... + "سوالات"
+    QUESTION_CREATE = _CATEGORIES  # + ... + "➕ سوال جدید"
     
     # Template paths (dynamic)
-    TEMPLATE_LIST = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "قالب‌ها"
-    TEMPLATE_VIEW = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "قالب‌ها" + template
-    TEMPLATE_CREATE = ("🔧 پنل مدیریت", "📂 مدیریت کاتالوگ", "دسته‌بندی‌ها")  # + ... + "➕ قالب جدید"
+    TEMPLATE_LIST = _CATEGORIES  # + ... + "قالب‌ها"
+    TEMPLATE_VIEW = _CATEGORIES  # + ... + "قالب‌ها" + template
+    TEMPLATE_CREATE = _CATEGORIES  # + ... + "➕ قالب جدید"
 
 
 class Breadcrumb:
     """Breadcrumb navigation manager.
     
-    Stores the navigation path in context.user_data['breadcrumb'] as a list of strings.
+    Stores the navigation path in context.user_data['breadcrumb'] as a list of strings,
+    and the rendered display string in context.user_data['breadcrumb_display'] until
+    the path next changes.
     """
     
     STORAGE_KEY = 'breadcrumb'
+    DISPLAY_KEY = 'breadcrumb_display'
     SEPARATOR = " › "
     PREFIX = "\n\n📍 "
     
     def __init__(self, context: ContextTypes.DEFAULT_TYPE):
         """Initialize breadcrumb with context."""
         self.context = context
-        if self.STORAGE_KEY not in context.user_data:
-            context.user_data[self.STORAGE_KEY] = []
+        path = context.user_data.get(self.STORAGE_KEY)
+        if path is None:
+            path = context.user_data[self.STORAGE_KEY] = []
+        # The stored list is only ever mutated in place, never rebound, so
+        # this reference stays valid for every Breadcrumb on the same context
+        self._path_ref: List[str] = path
     
     @property
     def path(self) -> List[str]:
-        """Get the current breadcrumb path."""
-        return self.context.user_data.get(self.STORAGE_KEY, [])
+        """Get a copy of the current breadcrumb path.
+        
+        Change the path through the methods or the setter, which keep the
+        cached display string in sync.
+        """
+        return list(self._path_ref)
     
     @path.setter
     def path(self, value: List[str]) -> None:
         """Set the breadcrumb path."""
-        self.context.user_data[self.STORAGE_KEY] = value
+        self._path_ref[:] = value
+        self._changed()
+    
+    def _changed(self) -> None:
+        """Drop the cached display string after the path was mutated."""
+        self.context.user_data.pop(self.DISPLAY_KEY, None)
     
     def clear(self) -> None:
         """Clear the breadcrumb path."""
-        self.path = []
+        self._path_ref.clear()
+        self._changed()
     
     def set_path(self, base: BreadcrumbPath, *extras: str) -> None:
         """Set the breadcrumb to a predefined path with optional extra items.
@@ -121,7 +147,9 @@ class Breadcrumb:
             base: A predefined BreadcrumbPath
             extras: Additional path items to append
         """
-        self.path = list(base.value) + list(extras)
+        self._path_ref[:] = base.value
+        self._path_ref.extend(extras)
+        self._changed()
     
     def push(self, item: str) -> None:
         """Add an item to the end of the breadcrumb path.
@@ -129,9 +157,8 @@ class Breadcrumb:
         Args:
             item: The item to add
         """
-        path = self.path
-        path.append(item)
-        self.path = path
+        self._path_ref.append(item)
+        self._changed()
     
     def pop(self) -> Optional[str]:
         """Remove and return the last item from the breadcrumb path.
@@ -139,11 +166,9 @@ class Breadcrumb:
         Returns:
             The removed item, or None if path is empty
         """
-        path = self.path
-        if path:
-            item = path.pop()
-            self.path = path
-            return item
+        if self._path_ref:
+            self._changed()
+            return self._path_ref.pop()
         return None
     
     def go_back_to(self, item: str) -> bool:
@@ -155,13 +180,13 @@ class Breadcrumb:
         Returns:
             True if the item was found and path was trimmed, False otherwise
         """
-        path = self.path
         try:
-            index = path.index(item)
-            self.path = path[:index + 1]
-            return True
+            index = self._path_ref.index(item)
         except ValueError:
             return False
+        del self._path_ref[index + 1:]
+        self._changed()
+        return True
     
     def replace_last(self, item: str) -> None:
         """Replace the last item in the breadcrumb path.
@@ -169,12 +194,11 @@ class Breadcrumb:
         Args:
             item: The new item to replace with
         """
-        path = self.path
-        if path:
-            path[-1] = item
+        if self._path_ref:
+            self._path_ref[-1] = item
         else:
-            path.append(item)
-        self.path = path
+            self._path_ref.append(item)
+        self._changed()
     
     def get_display(self) -> str:
         """Get the formatted breadcrumb string for display.
@@ -182,9 +206,11 @@ class Breadcrumb:
         Returns:
             Formatted breadcrumb string like "📍 پنل مدیریت › کاتالوگ › دسته‌ها"
         """
-        if not self.path:
-            return ""
-        return f"{self.PREFIX}{self.SEPARATOR.join(self.path)}"
+        display = self.context.user_data.get(self.DISPLAY_KEY)
+        if display is None:
+            display = f"{self.PREFIX}{self.SEPARATOR.join(self._path_ref)}" if self._path_ref else ""
+            self.context.user_data[self.DISPLAY_KEY] = display
+        return display
     
     def format_message(self, message: str, include_breadcrumb: bool = True) -> str:
         """Format a message with the breadcrumb appended.
@@ -206,11 +232,11 @@ class Breadcrumb:
     
     def __len__(self) -> int:
         """Return the length of the breadcrumb path."""
-        return len(self.path)
+        return len(self._path_ref)
     
     def __bool__(self) -> bool:
         """Return True if breadcrumb has any items."""
-        return bool(self.path)
+        return bool(self._path_ref)
     
     def __str__(self) -> str:
         """Return the formatted breadcrumb display."""
@@ -218,7 +244,7 @@ class Breadcrumb:
     
     def __repr__(self) -> str:
         """Return a debug representation."""
-        return f"Breadcrumb({self.path})"
+        return f"Breadcrumb({self._path_ref})"
 
 
 def get_breadcrumb(context: ContextTypes.DEFAULT_TYPE) -> Breadcrumb:
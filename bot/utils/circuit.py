@@ -0,0 +1,71 @@
+"""Circuit breaker for calls to an unreliable dependency.
+
+After a run of consecutive failures the circuit opens and calls are
+rejected immediately instead of waiting on timeouts. Once the recovery
+window has passed a single probe call is let through: success closes the
+circuit, failure opens it for another window.
+
+Usage:
+    from utils.circuit import CircuitBreaker
+
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+    if not breaker.allow():
+        return None
+    try:
+        result = await call()
+    except Exception:
+        breaker.record_failure()
+        raise
+    breaker.record_success()
+"""
+
+import time
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """States of a circuit breaker."""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while a dependency keeps failing."""
+    
+    __slots__ = ("failure_threshold", "recovery_timeout", "state", "failure_count", "opened_at")
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+    
+    def allow(self) -> bool:
+        """Check whether a call may go through right now.
+        
+        In the open state one probe is admitted per recovery window, so a
+        probe that never reports back cannot keep the circuit half-open.
+        """
+        if self.state is CircuitState.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.recovery_timeout:
+            return False
+        self.state = CircuitState.HALF_OPEN
+        self.opened_at = now
+        return True
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+    
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failure_count += 1
+        if self.state is CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
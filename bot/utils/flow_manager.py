@@ -4,6 +4,7 @@ This module provides a centralized way to manage conversation flow state,
 replacing the problematic ConversationHandler approach.
 """
 
+from dataclasses import dataclass, field
 from typing import Optional, Any, Dict
 from telegram.ext import ContextTypes
 
@@ -18,6 +19,31 @@ FLOW_TRACKING = "tracking"
 FLOW_QUESTIONNAIRE = "questionnaire"
 FLOW_TEMPLATES = "templates"
 
+# All flow state lives under this single user_data key
+FLOW_STATE_KEY = '_flow'
+
+
+@dataclass(slots=True)
+class FlowState:
+    """Active flow, step and flow-specific data for one user."""
+    
+    flow: Optional[str] = None
+    step: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def _get_state(context: ContextTypes.DEFAULT_TYPE) -> Optional[FlowState]:
+    """Return the user's flow state, or None without creating one."""
+    return context.user_data.get(FLOW_STATE_KEY)
+
+
+def _ensure_state(context: ContextTypes.DEFAULT_TYPE) -> FlowState:
+    """Return the user's flow state, creating an empty one if needed."""
+    state = context.user_data.get(FLOW_STATE_KEY)
+    if state is None:
+        state = context.user_data[FLOW_STATE_KEY] = FlowState()
+    return state
+
 
 def set_flow(
     context: ContextTypes.DEFAULT_TYPE,
@@ -33,10 +59,11 @@ def set_flow(
         step: Current step within the flow (e.g., 'category_create_name')
         data: Optional flow-specific data to store
     """
-    context.user_data['current_flow'] = flow
-    context.user_data['flow_step'] = step
+    state = _ensure_state(context)
+    state.flow = flow
+    state.step = step
     if data is not None:
-        context.user_data['flow_data'] = data
+        state.data = data
 
 
 def get_flow(context: ContextTypes.DEFAULT_TYPE) -> Optional[str]:
@@ -45,7 +72,8 @@ def get_flow(context: ContextTypes.DEFAULT_TYPE) -> Optional[str]:
     Returns:
         Current flow name or None if no flow is active
     """
-    return context.user_data.get('current_flow')
+    state = _get_state(context)
+    return state.flow if state is not None else None
 
 
 def get_step(context: ContextTypes.DEFAULT_TYPE) -> Optional[str]:
@@ -54,7 +82,8 @@ def get_step(context: ContextTypes.DEFAULT_TYPE) -> Optional[str]:
     Returns:
         Current step name or None
     """
-    return context.user_data.get('flow_step')
+    state = _get_state(context)
+    return state.step if state is not None else None
 
 
 def get_flow_data(context: ContextTypes.DEFAULT_TYPE) -> Dict[str, Any]:
@@ -63,7 +92,8 @@ def get_flow_data(context: ContextTypes.DEFAULT_TYPE) -> Dict[str, Any]:
     Returns:
         Flow data dictionary (empty dict if none)
     """
-    return context.user_data.get('flow_data', {})
+    state = _get_state(context)
+    return state.data if state is not None else {}
 
 
 def set_step(context: ContextTypes.DEFAULT_TYPE, step: str) -> None:
@@ -73,7 +103,7 @@ def set_step(context: ContextTypes.DEFAULT_TYPE, step: str) -> None:
         context: Telegram context
         step: New step name
     """
-    context.user_data['flow_step'] = step
+    _ensure_state(context).step = step
 
 
 def update_flow_data(context: ContextTypes.DEFAULT_TYPE, key: str, value: Any) -> None:
@@ -84,9 +114,7 @@ def update_flow_data(context: ContextTypes.DEFAULT_TYPE, key: str, value: Any) -
         key: Data key to update
         value: New value
     """
-    if 'flow_data' not in context.user_data:
-        context.user_data['flow_data'] = {}
-    context.user_data['flow_data'][key] = value
+    _ensure_state(context).data[key] = value
 
 
 def get_flow_data_item(context: ContextTypes.DEFAULT_TYPE, key: str, default: Any = None) -> Any:
@@ -100,7 +128,8 @@ def get_flow_data_item(context: ContextTypes.DEFAULT_TYPE, key: str, default: An
     Returns:
         The value or default
     """
-    return context.user_data.get('flow_data', {}).get(key, default)
+    state = _get_state(context)
+    return state.data.get(key, default) if state is not None else default
 
 
 def clear_flow(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -108,14 +137,14 @@ def clear_flow(context: ContextTypes.DEFAULT_TYPE) -> None:
     
     This should be called when exiting a flow (e.g., going back to main menu).
     """
-    context.user_data.pop('current_flow', None)
-    context.user_data.pop('flow_step', None)
-    context.user_data.pop('flow_data', None)
+    context.user_data.pop(FLOW_STATE_KEY, None)
 
 
 def clear_flow_data(context: ContextTypes.DEFAULT_TYPE) -> None:
     """Clear only the flow data, keeping flow and step."""
-    context.user_data.pop('flow_data', None)
+    state = _get_state(context)
+    if state is not None:
+        state.data = {}
 
 
 def is_in_flow(context: ContextTypes.DEFAULT_TYPE, flow: Optional[str] = None) -> bool:
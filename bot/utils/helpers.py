@@ -1,5 +1,7 @@
 """Helper utilities for the bot."""
 
+from typing import Tuple
+
 from telegram import ReplyKeyboardMarkup
 from telegram.ext import ContextTypes
 
@@ -24,10 +26,21 @@ async def get_user_menu_keyboard_async(
     if 'is_admin' not in context.user_data:
         user = await api_client.get_user(telegram_id)
         if user:
-            context.user_data['is_admin'] = user.get('role') == 'ADMIN'
-            context.user_data['user_role'] = user.get('role', 'CUSTOMER')
-            context.user_data['user_id'] = user.get('id')
-    return get_main_menu_keyboard(is_admin=context.user_data.get('is_admin', False))
-
+            context.user_data.update(
+                is_admin=user.get('role') == 'ADMIN',
+                user_role=user.get('role', 'CUSTOMER'),
+                user_id=user.get('id'),
+            )
+    return get_user_menu_keyboard(context)
 
 
+def parse_placeholder_coords(text: str) -> Tuple[int, int, int, int]:
+    """Parse template placeholder coordinates entered as ``x,y,width,height``.
+    
+    Raises:
+        ValueError: If the text is not exactly four comma-separated integers
+    """
+    parts = [int(p.strip()) for p in text.split(',')]
+    if len(parts) != 4:
+        raise ValueError("Need 4 values")
+    return parts[0], parts[1], parts[2], parts[3]
@@ -1,19 +1,30 @@
 """Notification utilities for sending messages to users."""
 
 import logging
-from typing import Optional, List
 
 from utils.api_client import api_client
 
 logger = logging.getLogger(__name__)
 
 
-async def get_admin_telegram_ids() -> List[int]:
-    """Get admin telegram IDs from database via API."""
-    result = await api_client.get_admin_telegram_ids()
-    if result:
-        return result
-    return []
+async def _notify_admins(bot, message: str, label: str) -> bool:
+    """Send a message to every admin concurrently; True if any send succeeded."""
+    async def send(admin_id: int) -> bool:
+        try:
+            await bot.send_message(
+                chat_id=admin_id,
+                text=message,
+            )
+            logger.info(f"Notified admin {admin_id} about {label}")
+            return True
+        except Exception as e:
+            logger.error(f"Error notifying admin {admin_id}: {e}")
+            return False
+    
+    results = await api_client.map_admins(send)
+    if not results:
+        logger.warning("No admin telegram IDs found in database for notifications")
+    return any(results)
 
 
 async def notify_admin_new_receipt(
@@ -24,12 +35,6 @@ async def notify_admin_new_receipt(
     customer_telegram_id: int,
 ) -> bool:
     """Notify admin about a new receipt upload."""
-    admin_telegram_ids = await get_admin_telegram_ids()
-    
-    if not admin_telegram_ids:
-        logger.warning("No admin telegram IDs found in database for notifications")
-        return False
-    
     message = (
         "🔔 رسید جدید دریافت شد!\n\n"
         f"شماره پرداخت: #{payment_id[:8]}\n"
@@ -38,19 +43,7 @@ async def notify_admin_new_receipt(
         "برای بررسی به بخش «پرداخت‌های در انتظار تأیید» مراجعه کنید."
     )
     
-    success = False
-    for admin_id in admin_telegram_ids:
-        try:
-            await bot.send_message(
-                chat_id=admin_id,
-                text=message,
-            )
-            success = True
-            logger.info(f"Notified admin {admin_id} about new receipt {payment_id}")
-        except Exception as e:
-            logger.error(f"Error notifying admin {admin_id}: {e}")
-    
-    return success
+    return await _notify_admins(bot, message, f"new receipt {payment_id}")
 
 
 async def notify_customer_payment_approved(